@@ -2,7 +2,12 @@
 
 import os
 import json
+import time
 import asyncio
+import hashlib
+import logging
+import textwrap
+from pathlib import Path
 
 import streamlit as st
 from langchain_core.messages import HumanMessage, AIMessage
@@ -12,6 +17,9 @@ from src.utils.data_manager import DataManager
 from src.graph import create_agents_graph
 
 
+logger = logging.getLogger(__name__)
+
+
 # Page configuration
 st.set_page_config(
     page_title="SAGE - Academic Assistant",
@@ -20,17 +28,73 @@ st.set_page_config(
 )
 
 
+@st.cache_data(ttl=24 * 60 * 60)
 def load_data():
-    """Load data files."""
-    with open("data/sample_profile.json", "r") as f:
-        profile_data = f.read()
-    with open("data/sample_calendar.json", "r") as f:
-        calendar_data = f.read()
-    with open("data/sample_tasks.json", "r") as f:
-        task_data = f.read()
+    """Load data files.
+
+    The sample files are static, so the raw JSON strings are cached and
+    served from memory instead of being re-read on every fresh session.
+    """
+    profile_data = Path("data/sample_profile.json").read_text()
+    calendar_data = Path("data/sample_calendar.json").read_text()
+    task_data = Path("data/sample_tasks.json").read_text()
     return profile_data, calendar_data, task_data
 
 
+def get_event_loop():
+    """Return this session's event loop, creating it on first use.
+
+    asyncio.run would build and tear down a loop per chat turn, discarding
+    any async resources (e.g. the Gemini client's HTTP connections) held
+    on it. The loop lives in st.session_state rather than a cache_resource
+    singleton: Streamlit runs each session on its own thread, and two
+    sessions driving one shared loop would collide in run_until_complete.
+    """
+    loop = st.session_state.get("event_loop")
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        st.session_state.event_loop = loop
+    return loop
+
+
+def get_llm(api_key: str):
+    """Return this session's Gemini LLM client, rebuilt if the key changes.
+
+    The client is cheap to construct — the underlying GenerativeModel and
+    its HTTP transport are shared at class level — but token_sink is
+    mutable per-turn state, so the wrapper is scoped to the session
+    instead of being shared across sessions via st.cache_resource, where
+    concurrent turns would stomp each other's sinks and interleave token
+    streams.
+    """
+    llm = st.session_state.get("llm")
+    if llm is None or st.session_state.get("llm_api_key") != api_key:
+        llm = GeminiLLM(api_key)
+        st.session_state.llm = llm
+        st.session_state.llm_api_key = api_key
+    return llm
+
+
+def get_graph(api_key: str):
+    """Return the compiled agent workflow bound to this session's LLM.
+
+    Graph compilation (coordinator plus the three agent subgraphs) is pure
+    CPU work that depends only on the LLM identity; create_agents_graph
+    memoizes per LLM instance, so each session compiles once and reuses
+    the result across turns. The graph follows the session-scoped LLM so
+    streamed tokens reach the right session's sink.
+    """
+    return create_agents_graph(get_llm(api_key))
+
+
+@st.cache_resource
+def get_data_manager(profile_json: str, calendar_json: str, task_json: str):
+    """Build and load a DataManager once per set of input JSON strings."""
+    dm = DataManager()
+    dm.load_data(profile_json, calendar_json, task_json)
+    return dm
+
+
 def init_session_state():
     """Initialize session state variables."""
     if "messages" not in st.session_state:
@@ -42,37 +106,103 @@ def init_session_state():
         st.session_state.task_data = tasks
 
 
+# String payload keys the agents are known to emit; probing these directly
+# avoids walking and type-checking every value in the output dicts
+AGENT_STRING_KEYS = ("plan", "notes", "advice")
+
+
+def iter_output_strings(agent_output):
+    """Yield the displayable strings from a single agent's output.
+
+    Handles the three shapes agents produce: a bare string, a flat dict of
+    known string keys, and one defensive level of nesting below those keys.
+    """
+    if isinstance(agent_output, str):
+        if agent_output:
+            yield agent_output
+        return
+    if not isinstance(agent_output, dict):
+        return
+    for key in AGENT_STRING_KEYS:
+        value = agent_output.get(key)
+        if isinstance(value, str):
+            if value:
+                yield value
+        elif isinstance(value, dict):
+            for subvalue in value.values():
+                if isinstance(subvalue, str) and subvalue:
+                    yield subvalue
+
+
+# Number of most recent session messages sent to the workflow verbatim;
+# older turns are collapsed into a rolling summary to bound prompt tokens
+HISTORY_WINDOW = 6
+
+
+def summarize_older_turns(messages: list) -> str:
+    """Collapse turns that fell out of the history window into a short summary.
+
+    Messages only ever append, so the summary is cached in session state
+    keyed on how many messages it covers and recomputed only when more
+    turns age out of the window.
+    """
+    cached = st.session_state.get("history_summary")
+    if cached and cached[0] == len(messages):
+        return cached[1]
+
+    parts = []
+    for msg in messages:
+        if msg["role"] == "user":
+            parts.append(msg["content"])
+        else:
+            outputs = msg.get("results", {}).get("outputs", {})
+            parts.extend(
+                text
+                for output in outputs.values()
+                for text in iter_output_strings(output)
+            )
+
+    summary = textwrap.shorten(" ".join(parts), width=600, placeholder=" ...")
+    st.session_state.history_summary = (len(messages), summary)
+    return summary
+
+
 def build_conversation_history(messages: list) -> list:
-    """Convert session messages to LangChain message format."""
+    """Convert session messages to LangChain message format.
+
+    Keeps the last HISTORY_WINDOW messages verbatim and prepends a rolling
+    summary of anything older, so prompt size stays bounded as the chat
+    grows.
+    """
     history = []
+
+    if len(messages) > HISTORY_WINDOW:
+        summary = summarize_older_turns(messages[:-HISTORY_WINDOW])
+        if summary:
+            history.append(AIMessage(content=f"Summary of earlier conversation: {summary}"))
+        messages = messages[-HISTORY_WINDOW:]
+
     for msg in messages:
         if msg["role"] == "user":
             history.append(HumanMessage(content=msg["content"]))
         elif msg["role"] == "assistant":
-            # Extract text summary from agent results for context
+            # Extract text summary from agent results for context,
+            # truncating long responses
             outputs = msg.get("results", {}).get("outputs", {})
-            summary_parts = []
-            for agent_name, output in outputs.items():
-                if isinstance(output, dict):
-                    for key, value in output.items():
-                        if isinstance(value, str) and value:
-                            # Truncate long responses for context
-                            summary_parts.append(f"[{agent_name}]: {value[:500]}...")
-                elif isinstance(output, str):
-                    summary_parts.append(f"[{agent_name}]: {output[:500]}...")
-            if summary_parts:
-                history.append(AIMessage(content="\n".join(summary_parts)))
+            summary = "\n".join(
+                f"[{agent_name}]: {text[:500]}..."
+                for agent_name, output in outputs.items()
+                for text in iter_output_strings(output)
+            )
+            if summary:
+                history.append(AIMessage(content=summary))
     return history
 
 
 async def run_agent_workflow(user_input: str, api_key: str, conversation_history: list):
     """Run the multi-agent workflow with conversation context."""
-    # Initialize LLM
-    llm = GeminiLLM(api_key)
-
-    # Initialize data manager
-    dm = DataManager()
-    dm.load_data(
+    # Cached data manager (parsing repeats only when the inputs change)
+    dm = get_data_manager(
         st.session_state.profile_data,
         st.session_state.calendar_data,
         st.session_state.task_data
@@ -90,8 +220,8 @@ async def run_agent_workflow(user_input: str, api_key: str, conversation_history
         "results": {}
     }
 
-    # Create and run workflow
-    graph = create_agents_graph(llm)
+    # Cached compiled workflow (rebuilt only if the API key changes)
+    graph = get_graph(api_key)
 
     results = {
         "coordinator": None,
@@ -114,6 +244,116 @@ async def run_agent_workflow(user_input: str, api_key: str, conversation_history
     return results
 
 
+def history_cache_key(messages: list) -> str:
+    """Build a stable hash of the conversation so far for response caching.
+
+    Assistant turns carry their payload under "results", not "content",
+    so the hash extracts their output text the same way
+    build_conversation_history does — two histories that differ only in
+    what the agents answered must not share a cache key.
+    """
+    parts = []
+    for m in messages:
+        if m["role"] == "user":
+            parts.append(("user", m.get("content", "")))
+        else:
+            outputs = m.get("results", {}).get("outputs", {})
+            parts.append((
+                m["role"],
+                "\n".join(
+                    text
+                    for output in outputs.values()
+                    for text in iter_output_strings(output)
+                ),
+            ))
+    payload = json.dumps(parts)
+    return hashlib.blake2b(payload.encode()).hexdigest()
+
+
+# Minimum interval between streamed UI updates. Re-rendering the chat on
+# every Gemini chunk dominates streaming cost; ~20 fps is imperceptible
+# from the user's side while cutting rerenders by an order of magnitude.
+STREAM_FLUSH_INTERVAL = 0.05
+
+
+def workflow_token_stream(prompt: str, api_key: str, history: list, results: dict):
+    """Bridge the async workflow into a sync token generator for st.write_stream.
+
+    Partial tokens from every LLM call are forwarded through the shared
+    GeminiLLM token sink into a queue, and yielded here as they arrive so
+    the UI renders incrementally instead of buffering the full response.
+    Tokens are batched and flushed at most every STREAM_FLUSH_INTERVAL
+    seconds to throttle Streamlit rerenders. The final workflow results
+    are written into the `results` dict.
+    """
+    loop = get_event_loop()
+    llm = get_llm(api_key)
+    try:
+        queue = asyncio.Queue()
+        llm.token_sink = queue.put
+        task = asyncio.ensure_future(
+            run_agent_workflow(prompt, api_key, history), loop=loop
+        )
+
+        async def next_token():
+            getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait(
+                {getter, task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if getter in done:
+                return getter.result()
+            getter.cancel()
+            return None
+
+        buffer = []
+        last_emit = time.monotonic()
+
+        while True:
+            token = loop.run_until_complete(next_token())
+            if token is None:
+                # Workflow finished; drain any tokens still queued
+                while not queue.empty():
+                    buffer.append(queue.get_nowait())
+                break
+            buffer.append(token)
+            now = time.monotonic()
+            if now - last_emit >= STREAM_FLUSH_INTERVAL:
+                yield "".join(buffer)
+                buffer.clear()
+                last_emit = now
+
+        if buffer:
+            yield "".join(buffer)
+
+        results.update(loop.run_until_complete(task))
+    finally:
+        # The loop is a shared, session-lived resource — reset only the
+        # per-turn token sink and leave the loop open for the next turn
+        llm.token_sink = None
+
+
+def results_to_markdown(results: dict) -> str:
+    """Render agent results to a single Markdown string.
+
+    Used to memoize the rendering of past assistant messages: the chat
+    replay happens on every Streamlit rerun, so each message's output
+    dict is walked once and the rendered Markdown is reused afterwards.
+    """
+    if not results:
+        return ""
+
+    parts = []
+    if results.get("agents"):
+        parts.append(f"**Agents activated:** {', '.join(results['agents'])}")
+
+    for agent_name, agent_output in results.get("outputs", {}).items():
+        parts.append(f"### {agent_name.upper()}")
+        parts.extend(iter_output_strings(agent_output))
+        parts.append("---")
+
+    return "\n\n".join(parts)
+
+
 def display_results(results: dict):
     """Display agent results."""
     if not results:
@@ -134,17 +374,8 @@ def display_results(results: dict):
     for agent_name, agent_output in outputs.items():
         st.markdown(f"### {agent_name.upper()}")
 
-        if isinstance(agent_output, dict):
-            # Handle nested output structure
-            for key, value in agent_output.items():
-                if isinstance(value, dict):
-                    for subkey, subvalue in value.items():
-                        if subvalue and isinstance(subvalue, str):
-                            st.markdown(subvalue)
-                elif isinstance(value, str) and value:
-                    st.markdown(value)
-        elif isinstance(agent_output, str):
-            st.markdown(agent_output)
+        for text in iter_output_strings(agent_output):
+            st.markdown(text)
 
         st.markdown("---")
 
@@ -189,13 +420,21 @@ def main():
         st.code("export GOOGLE_API_KEY=your_api_key_here")
         return
 
-    # Display chat history
+    # Display chat history; assistant messages are rendered to Markdown
+    # once and replayed from the cached string on subsequent reruns
     for message in st.session_state.messages:
         with st.chat_message(message["role"]):
             if message["role"] == "user":
                 st.markdown(message["content"])
             else:
-                display_results(message.get("results", {}))
+                rendered = message.get("_rendered")
+                if rendered is None:
+                    rendered = results_to_markdown(message.get("results", {}))
+                    message["_rendered"] = rendered
+                if rendered:
+                    st.markdown(rendered)
+                else:
+                    st.warning("No agent outputs available.")
 
     # Handle pending prompt from sidebar
     if "pending_prompt" in st.session_state:
@@ -212,17 +451,34 @@ def main():
 
         # Process with agents
         with st.chat_message("assistant"):
-            with st.spinner("Processing your request..."):
-                try:
-                    # Build conversation history from previous messages
+            try:
+                # Cache key over prior messages so repeated prompts with
+                # the same context skip the LLM pipeline entirely
+                cache = st.session_state.setdefault("response_cache", {})
+                cache_key = (prompt, history_cache_key(st.session_state.messages[:-1]))
+
+                if cache_key in cache:
+                    results = cache[cache_key]
+                else:
                     history = build_conversation_history(st.session_state.messages[:-1])
-                    results = asyncio.run(run_agent_workflow(prompt, api_key, history))
-                    display_results(results)
-                    st.session_state.messages.append({"role": "assistant", "results": results})
-                except Exception as e:
-                    st.error(f"Error: {str(e)}")
-                    import traceback
-                    st.code(traceback.format_exc())
+                    results = {}
+                    # Stream partial tokens while the workflow runs, then
+                    # replace the raw stream with the structured results
+                    placeholder = st.empty()
+                    with placeholder.container():
+                        st.write_stream(
+                            workflow_token_stream(prompt, api_key, history, results)
+                        )
+                    placeholder.empty()
+                    cache[cache_key] = results
+
+                display_results(results)
+                st.session_state.messages.append({"role": "assistant", "results": results})
+            except Exception as e:
+                # Full stack trace goes to the log; the UI only shows a
+                # short message instead of rendering a large code block
+                logger.exception("Agent workflow failed")
+                st.error(f"Error: {str(e)}")
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ from .base import ReActAgent
 from .planner import PlannerAgent
 from .notewriter import NoteWriterAgent
 from .advisor import AdvisorAgent
-from .coordinator import coordinator_agent, profile_analyzer, set_llm
+from .coordinator import coordinator_agent, profile_analyzer
 from .prompts import COORDINATOR_PROMPT, PROFILE_ANALYZER_PROMPT
 
 __all__ = [
@@ -14,7 +14,6 @@ __all__ = [
     "AdvisorAgent",
     "coordinator_agent",
     "profile_analyzer",
-    "set_llm",
     "COORDINATOR_PROMPT",
     "PROFILE_ANALYZER_PROMPT"
 ]
@@ -6,9 +6,48 @@ from typing import Dict
 from langgraph.graph import StateGraph, END, START
 
 from src.state.academic_state import AcademicState
+from src.utils.serialization import dumps_cached
 from .base import ReActAgent
 
 
+# Static few-shot examples shared by every AdvisorAgent instance and
+# serialized once at import time for prompt interpolation
+FEW_SHOT_EXAMPLES = [
+    {
+        "request": "Managing multiple deadlines with limited time",
+        "profile": {
+            "learning_style": "visual",
+            "workload": "heavy",
+            "time_constraints": ["2 hackathons", "project", "exam"]
+        },
+        "advice": """PRIORITY-BASED SCHEDULE:
+
+        1. IMMEDIATE ACTIONS
+           • Create visual timeline of all deadlines
+           • Break each task into 45-min chunks
+           • Schedule high-focus work in mornings
+
+        2. WORKLOAD MANAGEMENT
+           • Hackathons: Form team early, set clear roles
+           • Project: Daily 2-hour focused sessions
+           • Exam: Interleaved practice with breaks
+
+        3. ENERGY OPTIMIZATION
+           • Use Pomodoro (25/5) for intensive tasks
+           • Physical activity between study blocks
+           • Regular progress tracking
+
+        4. EMERGENCY PROTOCOLS
+           • If overwhelmed: Take 10min reset break
+           • If stuck: Switch tasks or environments
+           • If tired: Quick power nap, then review"""
+    }
+]
+
+# Compact form: indentation in prompt JSON only inflates input tokens
+FEW_SHOT_JSON = json.dumps(FEW_SHOT_EXAMPLES, separators=(",", ":"))
+
+
 class AdvisorAgent(ReActAgent):
     """Academic advisor agent with subgraph workflow for personalized guidance.
 
@@ -24,45 +63,16 @@ class AdvisorAgent(ReActAgent):
         """
         super().__init__(llm)
         self.llm = llm
-
-        self.few_shot_examples = [
-            {
-                "request": "Managing multiple deadlines with limited time",
-                "profile": {
-                    "learning_style": "visual",
-                    "workload": "heavy",
-                    "time_constraints": ["2 hackathons", "project", "exam"]
-                },
-                "advice": """PRIORITY-BASED SCHEDULE:
-
-                1. IMMEDIATE ACTIONS
-                   • Create visual timeline of all deadlines
-                   • Break each task into 45-min chunks
-                   • Schedule high-focus work in mornings
-
-                2. WORKLOAD MANAGEMENT
-                   • Hackathons: Form team early, set clear roles
-                   • Project: Daily 2-hour focused sessions
-                   • Exam: Interleaved practice with breaks
-
-                3. ENERGY OPTIMIZATION
-                   • Use Pomodoro (25/5) for intensive tasks
-                   • Physical activity between study blocks
-                   • Regular progress tracking
-
-                4. EMERGENCY PROTOCOLS
-                   • If overwhelmed: Take 10min reset break
-                   • If stuck: Switch tasks or environments
-                   • If tired: Quick power nap, then review"""
-            }
-        ]
+        self.few_shot_examples = FEW_SHOT_EXAMPLES
+        self._few_shot_json = FEW_SHOT_JSON
         self.workflow = self.create_subgraph()
 
     def create_subgraph(self) -> StateGraph:
         """Creates Advisor's internal workflow as a state machine.
 
         The workflow consists of two main stages:
-        1. Situation analysis - Understanding student needs
+        1. Situation analysis - Understanding student needs, with the
+           conversation-history digest prepared concurrently
         2. Guidance generation - Creating personalized advice
 
         Returns:
@@ -71,10 +81,15 @@ class AdvisorAgent(ReActAgent):
         subgraph = StateGraph(AcademicState)
 
         subgraph.add_node("advisor_analyze", self.analyze_situation)
+        subgraph.add_node("advisor_prepare_history", self.prepare_history)
         subgraph.add_node("advisor_generate", self.generate_guidance)
 
+        # History preparation is CPU-only and independent of the analyze
+        # LLM call, so both fan out from START and join at generation
         subgraph.add_edge(START, "advisor_analyze")
+        subgraph.add_edge(START, "advisor_prepare_history")
         subgraph.add_edge("advisor_analyze", "advisor_generate")
+        subgraph.add_edge("advisor_prepare_history", "advisor_generate")
         subgraph.add_edge("advisor_generate", END)
 
         return subgraph.compile()
@@ -100,8 +115,8 @@ class AdvisorAgent(ReActAgent):
         prompt = f"""Analyze student situation and determine guidance approach:
 
         CONTEXT:
-        - Profile: {json.dumps(profile, indent=2)}
-        - Learning Preferences: {json.dumps(learning_prefs, indent=2)}
+        - Profile: {dumps_cached(profile)}
+        - Learning Preferences: {dumps_cached(learning_prefs)}
         - Request: {state['messages'][-1].content}
 
         ANALYZE:
@@ -141,15 +156,8 @@ class AdvisorAgent(ReActAgent):
         """
         analysis = state["results"].get("situation_analysis", "")
 
-        # Build conversation context
-        conversation_context = []
-        for msg in state["messages"][:-1]:
-            if hasattr(msg, 'content'):
-                role = "User" if msg.__class__.__name__ == "HumanMessage" else "Assistant"
-                content = msg.content[:400] + "..." if len(msg.content) > 400 else msg.content
-                conversation_context.append(f"{role}: {content}")
-
-        history_text = "\n".join(conversation_context[-4:]) if conversation_context else "This is the start of the conversation."
+        # Reuse the conversation digest computed once in the coordinator
+        history_text = state["results"].get("history_text") or "This is the start of the conversation."
 
         prompt = f"""Generate personalized academic guidance based on analysis:
 
@@ -159,7 +167,7 @@ class AdvisorAgent(ReActAgent):
         CONVERSATION HISTORY:
         {history_text}
 
-        EXAMPLES: {json.dumps(self.few_shot_examples, indent=2)}
+        EXAMPLES: {self._few_shot_json}
 
         If this is a follow-up question, reference and build upon the previous conversation context.
 
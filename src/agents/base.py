@@ -1,9 +1,16 @@
 """Base ReActAgent class for all specialized agents."""
 
+from types import MappingProxyType
 from typing import List, Dict
+from bisect import bisect_right
 from datetime import datetime, timezone
 
 from src.state.academic_state import AcademicState
+from src.utils.context import build_history_text
+
+# Shared read-only fallback for .get() chains, so misses do not allocate
+# a fresh dict per lookup
+_EMPTY = MappingProxyType({})
 
 
 class ReActAgent:
@@ -35,6 +42,49 @@ class ReActAgent:
             "check_performance": self.check_performance
         }
 
+    @staticmethod
+    def _compact(analysis, max_chars: int = 1200) -> str:
+        """
+        Compact an upstream analysis before prompt interpolation.
+
+        Analyzer outputs are interpolated verbatim into downstream
+        prompts, where every character is re-paid as input tokens on
+        each call. Keep the structured lines (bullets, numbered points,
+        headings) that carry the findings, drop free-running prose, and
+        cap the total size.
+
+        Args:
+            analysis: Raw analysis text (or a dict wrapping it)
+
+        Returns:
+            str: Compacted analysis bounded by max_chars
+        """
+        if isinstance(analysis, dict):
+            analysis = analysis.get("analysis", "") or ""
+        if not isinstance(analysis, str):
+            analysis = str(analysis)
+        if len(analysis) <= max_chars:
+            return analysis
+
+        kept = []
+        total = 0
+        for line in analysis.splitlines():
+            stripped = line.strip()
+            if not stripped:
+                continue
+            # Structured lines: bullets, numbering, or short headings
+            if stripped[0] in "-*•" or stripped[0].isdigit() or (
+                stripped.endswith(":") and len(stripped) < 80
+            ):
+                kept.append(stripped)
+                total += len(stripped) + 1
+                if total >= max_chars:
+                    break
+
+        if not kept:
+            return analysis[:max_chars]
+        return "\n".join(kept)
+
     async def search_calendar(self, state: AcademicState) -> List[Dict]:
         """
         Search for upcoming calendar events.
@@ -47,8 +97,36 @@ class ReActAgent:
         """
         events = state["calendar"].get("events", [])
         now = datetime.now(timezone.utc)
+
+        # DataManager pre-parses start times into "_start_ts" and sorts the
+        # events, so the future window is a single binary search instead of
+        # re-parsing every ISO timestamp on each invocation
+        if events and "_start_ts" in events[0]:
+            idx = bisect_right(events, now.timestamp(), key=lambda e: e.get("_start_ts", float("inf")))
+            return events[idx:]
+
         return [e for e in events if datetime.fromisoformat(e["start"]["dateTime"]) > now]
 
+    async def prepare_history(self, state: AcademicState) -> Dict:
+        """
+        Ensure the conversation-history digest is present in results.
+
+        Pure CPU work with no dependency on any LLM output, so subgraphs
+        run this node concurrently with their analyze stage and join the
+        two before generation. Reuses the digest computed by the
+        coordinator when available.
+
+        Args:
+            state (AcademicState): Current academic state
+
+        Returns:
+            Dict: Partial results containing the history digest
+        """
+        history_text = state.get("results", {}).get("history_text")
+        if history_text is None:
+            history_text = build_history_text(state["messages"])
+        return {"results": {"history_text": history_text}}
+
     async def analyze_tasks(self, state: AcademicState) -> List[Dict]:
         """
         Analyze academic tasks from the current state.
@@ -71,11 +149,11 @@ class ReActAgent:
         Returns:
             AcademicState: Updated state with learning style analysis
         """
-        profile = state["profile"]
+        prefs = state["profile"].get("learning_preferences", _EMPTY)
 
         learning_data = {
-            "style": profile.get("learning_preferences", {}).get("learning_style", {}),
-            "patterns": profile.get("learning_preferences", {}).get("study_patterns", {})
+            "style": prefs.get("learning_style", {}),
+            "patterns": prefs.get("study_patterns", {})
         }
 
         if "results" not in state:
@@ -94,8 +172,7 @@ class ReActAgent:
         Returns:
             AcademicState: Updated state with performance analysis
         """
-        profile = state["profile"]
-        courses = profile.get("academic_info", {}).get("current_courses", [])
+        courses = state["profile"].get("academic_info", _EMPTY).get("current_courses", [])
 
         if "results" not in state:
             state["results"] = {}
@@ -1,24 +1,21 @@
 """Coordinator agent and profile analyzer for orchestrating multi-agent workflows."""
 
 import json
+import hashlib
 from typing import Dict
 
 from src.state.academic_state import AcademicState
-from src.utils.context import analyze_context, parse_coordinator_response
+from src.utils.context import analyze_context, build_history_text, parse_coordinator_response
 from .prompts import COORDINATOR_PROMPT, PROFILE_ANALYZER_PROMPT
 
 
-# Global LLM instance - will be set when creating the graph
-llm = None
+# Profile analyses keyed by a digest of the profile content. The profile
+# does not change mid-session and the analysis is a deterministic function
+# of it, so a hit saves an entire LLM call per turn.
+_profile_analysis_cache: Dict[bytes, str] = {}
 
 
-def set_llm(llm_instance):
-    """Set the global LLM instance for coordinator functions."""
-    global llm
-    llm = llm_instance
-
-
-async def coordinator_agent(state: AcademicState) -> Dict:
+async def coordinator_agent(state: AcademicState, llm) -> Dict:
     """
     Primary coordinator agent that orchestrates multiple academic support agents using ReACT framework.
 
@@ -28,8 +25,13 @@ async def coordinator_agent(state: AcademicState) -> Dict:
     3. Coordinates parallel agent execution
     4. Handles fallback scenarios
 
+    The llm is bound in by the graph builder (via functools.partial), so
+    each compiled graph's coordinator talks to its own client rather
+    than a module-level global that every graph would share.
+
     Args:
         state (AcademicState): Current academic state including messages and context
+        llm: Language model client bound to the owning graph
 
     Returns:
         Dict: Coordination analysis including required agents, priorities, and execution groups
@@ -38,22 +40,15 @@ async def coordinator_agent(state: AcademicState) -> Dict:
         context = await analyze_context(state)
         query = state["messages"][-1].content
 
-        # Build conversation history summary for context
-        history_summary = []
-        for msg in state["messages"][:-1]:  # Exclude current message
-            if hasattr(msg, 'content'):
-                role = "User" if msg.__class__.__name__ == "HumanMessage" else "Assistant"
-                # Truncate long messages
-                content = msg.content[:300] + "..." if len(msg.content) > 300 else msg.content
-                history_summary.append(f"{role}: {content}")
-
-        history_text = "\n".join(history_summary[-6:]) if history_summary else "No previous conversation"
+        # Build conversation history digest once per turn; downstream agents
+        # reuse it via state["results"]["history_text"]
+        history_text = build_history_text(state["messages"])
 
         response = await llm.agenerate([
             {"role": "system", "content": COORDINATOR_PROMPT.format(
                 request=query,
-                context=json.dumps(context, indent=2),
-                history=history_text
+                context=json.dumps(context, separators=(",", ":")),
+                history=history_text or "No previous conversation"
             )}
         ])
 
@@ -65,7 +60,8 @@ async def coordinator_agent(state: AcademicState) -> Dict:
                     "priority": analysis.get("priority", {"PLANNER": 1}),
                     "concurrent_groups": analysis.get("concurrent_groups", [["PLANNER"]]),
                     "reasoning": response
-                }
+                },
+                "history_text": history_text
             }
         }
 
@@ -83,7 +79,7 @@ async def coordinator_agent(state: AcademicState) -> Dict:
         }
 
 
-async def profile_analyzer(state: AcademicState) -> Dict:
+async def profile_analyzer(state: AcademicState, llm) -> Dict:
     """
     Analyzes student profile data to extract and interpret learning preferences using ReACT framework.
 
@@ -95,18 +91,24 @@ async def profile_analyzer(state: AcademicState) -> Dict:
 
     Args:
         state (AcademicState): Current academic state containing student profile data
+        llm: Language model client bound to the owning graph
 
     Returns:
         Dict: Structured analysis results including learning preferences and recommendations
     """
     profile = state["profile"]
-
-    messages = [
-        {"role": "system", "content": PROFILE_ANALYZER_PROMPT},
-        {"role": "user", "content": json.dumps(profile)}
-    ]
-
-    response = await llm.agenerate(messages)
+    profile_json = json.dumps(profile, sort_keys=True)
+    cache_key = hashlib.blake2b(profile_json.encode()).digest()
+
+    response = _profile_analysis_cache.get(cache_key)
+    if response is None:
+        messages = [
+            {"role": "system", "content": PROFILE_ANALYZER_PROMPT},
+            {"role": "user", "content": profile_json}
+        ]
+
+        response = await llm.agenerate(messages)
+        _profile_analysis_cache[cache_key] = response
 
     return {
         "results": {
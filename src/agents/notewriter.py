@@ -6,9 +6,46 @@ from typing import Dict
 from langgraph.graph import StateGraph, END, START
 
 from src.state.academic_state import AcademicState
+from src.utils.serialization import dumps_cached
 from .base import ReActAgent
 
 
+# Static few-shot examples shared by every NoteWriterAgent instance and
+# serialized once at import time for prompt interpolation
+FEW_SHOT_EXAMPLES = [
+    {
+        "input": "Need to cram Calculus III for tomorrow",
+        "template": "Quick Review",
+        "notes": """CALCULUS III ESSENTIALS:
+
+        1. CORE CONCEPTS (80/20 Rule):
+           • Multiple Integrals → volume/area
+           • Vector Calculus → flow/force/rotation
+           • KEY FORMULAS:
+             - Triple integrals in cylindrical/spherical coords
+             - Curl, divergence, gradient relationships
+
+        2. COMMON EXAM PATTERNS:
+           • Find critical points
+           • Calculate flux/work
+           • Optimize with constraints
+
+        3. QUICKSTART GUIDE:
+           • Always draw 3D diagrams
+           • Check units match
+           • Use symmetry to simplify
+
+        4. EMERGENCY TIPS:
+           • If stuck, try converting coordinates
+           • Check boundary conditions
+           • Look for special patterns"""
+    }
+]
+
+# Compact form: indentation in prompt JSON only inflates input tokens
+FEW_SHOT_JSON = json.dumps(FEW_SHOT_EXAMPLES, separators=(",", ":"))
+
+
 class NoteWriterAgent(ReActAgent):
     """NoteWriter agent with its own subgraph workflow for note generation.
 
@@ -24,42 +61,16 @@ class NoteWriterAgent(ReActAgent):
         """
         super().__init__(llm)
         self.llm = llm
-        self.few_shot_examples = [
-            {
-                "input": "Need to cram Calculus III for tomorrow",
-                "template": "Quick Review",
-                "notes": """CALCULUS III ESSENTIALS:
-
-                1. CORE CONCEPTS (80/20 Rule):
-                   • Multiple Integrals → volume/area
-                   • Vector Calculus → flow/force/rotation
-                   • KEY FORMULAS:
-                     - Triple integrals in cylindrical/spherical coords
-                     - Curl, divergence, gradient relationships
-
-                2. COMMON EXAM PATTERNS:
-                   • Find critical points
-                   • Calculate flux/work
-                   • Optimize with constraints
-
-                3. QUICKSTART GUIDE:
-                   • Always draw 3D diagrams
-                   • Check units match
-                   • Use symmetry to simplify
-
-                4. EMERGENCY TIPS:
-                   • If stuck, try converting coordinates
-                   • Check boundary conditions
-                   • Look for special patterns"""
-            }
-        ]
+        self.few_shot_examples = FEW_SHOT_EXAMPLES
+        self._few_shot_json = FEW_SHOT_JSON
         self.workflow = self.create_subgraph()
 
     def create_subgraph(self) -> StateGraph:
         """Creates NoteWriter's internal workflow as a state machine.
 
         The workflow consists of two main steps:
-        1. Analyze learning style and content requirements
+        1. Analyze learning style and content requirements, with the
+           conversation-history digest prepared concurrently
         2. Generate personalized notes
 
         Returns:
@@ -68,10 +79,15 @@ class NoteWriterAgent(ReActAgent):
         subgraph = StateGraph(AcademicState)
 
         subgraph.add_node("notewriter_analyze", self.analyze_learning_style)
+        subgraph.add_node("notewriter_prepare_history", self.prepare_history)
         subgraph.add_node("notewriter_generate", self.generate_notes)
 
+        # History preparation is CPU-only and independent of the analyze
+        # LLM call, so both fan out from START and join at generation
         subgraph.add_edge(START, "notewriter_analyze")
+        subgraph.add_edge(START, "notewriter_prepare_history")
         subgraph.add_edge("notewriter_analyze", "notewriter_generate")
+        subgraph.add_edge("notewriter_prepare_history", "notewriter_generate")
         subgraph.add_edge("notewriter_generate", END)
 
         return subgraph.compile()
@@ -96,7 +112,7 @@ class NoteWriterAgent(ReActAgent):
         prompt = f"""Analyze content requirements and determine optimal note structure:
 
         STUDENT PROFILE:
-        - Learning Style: {json.dumps(learning_style, indent=2)}
+        - Learning Style: {dumps_cached(learning_style)}
         - Request: {state['messages'][-1].content}
 
         FORMAT:
@@ -140,27 +156,20 @@ class NoteWriterAgent(ReActAgent):
         analysis = state["results"].get("learning_analysis", "")
         learning_style = state["profile"]["learning_preferences"]["learning_style"]
 
-        # Build conversation context
-        conversation_context = []
-        for msg in state["messages"][:-1]:
-            if hasattr(msg, 'content'):
-                role = "User" if msg.__class__.__name__ == "HumanMessage" else "Assistant"
-                content = msg.content[:400] + "..." if len(msg.content) > 400 else msg.content
-                conversation_context.append(f"{role}: {content}")
-
-        history_text = "\n".join(conversation_context[-4:]) if conversation_context else "This is the start of the conversation."
+        # Reuse the conversation digest computed once in the coordinator
+        history_text = state["results"].get("history_text") or "This is the start of the conversation."
 
         prompt = f"""Create concise, high-impact study materials based on analysis:
 
         ANALYSIS: {analysis}
-        LEARNING STYLE: {json.dumps(learning_style, indent=2)}
+        LEARNING STYLE: {dumps_cached(learning_style)}
         REQUEST: {state['messages'][-1].content}
 
         CONVERSATION HISTORY:
         {history_text}
 
         EXAMPLES:
-        {json.dumps(self.few_shot_examples, indent=2)}
+        {self._few_shot_json}
 
         If this is a follow-up question, reference and build upon the previous conversation context.
 
@@ -1,23 +1,146 @@
 """Planner Agent for scheduling and time management."""
 
 import json
+import textwrap
+import time
 from typing import Dict
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timezone, timedelta
 
-from langgraph.graph import StateGraph
+from langgraph.graph import StateGraph, START
+from langchain_core.messages import HumanMessage
 
 from src.state.academic_state import AcademicState
 from .base import ReActAgent
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        """Serialize prompt payloads with the C-level orjson encoder."""
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        """Stdlib fallback when orjson is unavailable (compact form).
+
+        default=str matches orjson's native datetime handling: task
+        payloads carry a datetime under due_datetime, which json.dumps
+        would otherwise reject.
+        """
+        return json.dumps(obj, separators=(",", ":"), default=str)
+
+# Constant-folded once at import; the analyzer window is always a week
+_WEEK = timedelta(days=7)
+
+# Pre-bound for the string-parsing fallback path, skipping the attribute
+# lookup per event
+_fromiso = datetime.fromisoformat
+
 
 class PlannerAgent(ReActAgent):
     """Planner agent with subgraph workflow for scheduling and time management."""
 
+    # Seconds before the server-side prefix TTL at which the CachedContent
+    # handle is re-registered, so an in-flight call never races the expiry
+    PREFIX_REFRESH_MARGIN_SECONDS = 30
+
+    # Static analyzer prompts, built once at class definition instead of
+    # per call on the hot async path. Dedented at class load: the
+    # indentation from the source layout is pure token overhead.
+    CALENDAR_ANALYZER_PROMPT = textwrap.dedent("""\
+        Analyze calendar events and identify:
+        Events: {events}
+
+        Focus on:
+        - Available time blocks
+        - Energy impact of activities
+        - Potential conflicts
+        - Recovery periods
+        - Study opportunity windows
+        - Activity patterns
+        - Schedule optimization
+        """)
+
+    # Static portion of the plan-generator prompt. Kept separate from the
+    # per-request context so it can be registered as a server-side cached
+    # prefix (Gemini CachedContent) and not re-processed on every call.
+    PLAN_GENERATOR_INSTRUCTIONS = textwrap.dedent("""\
+        AI Planning Assistant: Create focused study plan using ReACT framework.
+
+        EXAMPLES:
+        {examples}
+
+        INSTRUCTIONS:
+        1. Follow ReACT pattern:
+          Thought: Analyze situation and needs
+          Action: Consider all analyses
+          Observation: Synthesize findings
+          Plan: Create structured plan
+
+        2. Address:
+          - ADHD management strategies
+          - Energy level optimization
+          - Task chunking methods
+          - Focus period scheduling
+          - Environment switching tactics
+          - Recovery period planning
+          - Social/sport activity balance
+
+        3. Include:
+          - Emergency protocols
+          - Backup strategies
+          - Quick wins
+          - Reward system
+          - Progress tracking
+          - Adjustment triggers
+
+        4. If this is a follow-up question, reference and build upon the previous conversation context.
+
+        Pls act as an intelligent tool to help the students reach their goals or overcome struggles and answer with informal words.
+
+        FORMAT:
+        Thought: [reasoning and situation analysis]
+        Action: [synthesis approach]
+        Observation: [key findings]
+        Plan: [actionable steps and structural schedule]
+        """)
+
+    TASK_ANALYZER_PROMPT = textwrap.dedent("""\
+        Analyze tasks and create priority structure:
+        Tasks: {tasks}
+
+        Consider:
+        - Urgency levels
+        - Task complexity
+        - Energy requirements
+        - Dependencies
+        - Required focus levels
+        - Time estimations
+        - Learning objectives
+        - Success criteria
+        """)
+
     def __init__(self, llm):
         """Initialize the Planner agent with LLM and example templates."""
         super().__init__(llm)
         self.llm = llm
         self.few_shot_examples = self._initialize_fewshots()
+        # Few-shot examples are immutable after construction; serialize
+        # once (compact form to keep prompt tokens down)
+        self._few_shot_json = _dumps(self.few_shot_examples)
+        self._plan_system = self.PLAN_GENERATOR_INSTRUCTIONS.format(examples=self._few_shot_json)
+        # Server-side cached prefix for the static plan instructions,
+        # registered lazily on the first plan_generator call and
+        # re-registered once its server-side TTL approaches; the handle
+        # itself dies on the server at the TTL, so it must never be
+        # treated as valid forever
+        self._plan_prefix = None
+        self._plan_prefix_deadline = 0.0
+        # Compiled per instance: the node callables are bound methods, so
+        # a shared compilation would pin every later instance to the
+        # first one's llm. Compile-once still holds in practice — agents
+        # are built once per llm via create_agents_graph's memoization
+        # and the executor's agent reuse
         self.workflow = self.create_subgraph()
 
     def _initialize_fewshots(self):
@@ -77,9 +200,9 @@ class PlannerAgent(ReActAgent):
     def create_subgraph(self) -> StateGraph:
         """
         Create a workflow graph that defines how the planner processes requests:
-        1. First analyzes calendar (calendar_analyzer)
-        2. Then analyzes tasks (task_analyzer)
-        3. Finally generates a plan (plan_generator)
+        1. Analyzes calendar and tasks concurrently (no data dependency
+           between them, so their LLM round trips overlap)
+        2. Generates a plan once both analyses are in (plan_generator)
         """
         subgraph = StateGraph(AcademicState)
 
@@ -87,11 +210,13 @@ class PlannerAgent(ReActAgent):
         subgraph.add_node("task_analyzer", self.task_analyzer)
         subgraph.add_node("plan_generator", self.plan_generator)
 
-        subgraph.add_edge("calendar_analyzer", "task_analyzer")
+        # Both analyzers fan out from START; LangGraph awaits both before
+        # running plan_generator
+        subgraph.add_edge(START, "calendar_analyzer")
+        subgraph.add_edge(START, "task_analyzer")
+        subgraph.add_edge("calendar_analyzer", "plan_generator")
         subgraph.add_edge("task_analyzer", "plan_generator")
 
-        subgraph.set_entry_point("calendar_analyzer")
-
         return subgraph.compile()
 
     async def calendar_analyzer(self, state: AcademicState) -> Dict:
@@ -103,32 +228,40 @@ class PlannerAgent(ReActAgent):
         """
         events = state["calendar"].get("events", [])
         now = datetime.now(timezone.utc)
-        future = now + timedelta(days=7)
-
-        filtered_events = [
-            event for event in events
-            if now <= datetime.fromisoformat(event["start"]["dateTime"]) <= future
-        ]
-
-        prompt = """Analyze calendar events and identify:
-        Events: {events}
-
-        Focus on:
-        - Available time blocks
-        - Energy impact of activities
-        - Potential conflicts
-        - Recovery periods
-        - Study opportunity windows
-        - Activity patterns
-        - Schedule optimization
-        """
+        future = now + _WEEK
+
+        if events and "_start_ts" in events[0]:
+            # DataManager pre-parses and sorts by the "_start_ts" epoch key,
+            # so the 7-day window is two binary searches over cheap floats
+            # instead of an ISO parse per event per request
+            start_key = lambda e: e.get("_start_ts", float("inf"))
+            lo = bisect_left(events, now.timestamp(), key=start_key)
+            hi = bisect_right(events, future.timestamp(), key=start_key)
+            filtered_events = events[lo:hi]
+        else:
+            filtered_events = [
+                event for event in events
+                if now <= _fromiso(event["start"]["dateTime"]) <= future
+            ]
+
+        # Nothing to analyze: skip the network round trip entirely
+        if not filtered_events:
+            return {
+                "results": {
+                    "calendar_analysis": {
+                        "analysis": "No upcoming events in the next 7 days."
+                    }
+                }
+            }
 
         messages = [
-            {"role": "system", "content": prompt},
-            {"role": "user", "content": json.dumps(filtered_events)}
+            {"role": "system", "content": self.CALENDAR_ANALYZER_PROMPT},
+            {"role": "user", "content": _dumps(filtered_events)}
         ]
 
-        response = await self.llm.agenerate(messages)
+        # Intermediate analysis feeding the planner; a tight output cap
+        # roughly halves decode time versus the config-wide default
+        response = await self.llm.agenerate(messages, max_tokens=384)
 
         return {
             "results": {
@@ -147,26 +280,24 @@ class PlannerAgent(ReActAgent):
         """
         tasks = state["tasks"].get("tasks", [])
 
-        prompt = """Analyze tasks and create priority structure:
-        Tasks: {tasks}
-
-        Consider:
-        - Urgency levels
-        - Task complexity
-        - Energy requirements
-        - Dependencies
-        - Required focus levels
-        - Time estimations
-        - Learning objectives
-        - Success criteria
-        """
+        # Nothing to analyze: skip the network round trip entirely
+        if not tasks:
+            return {
+                "results": {
+                    "task_analysis": {
+                        "analysis": "No active tasks on record."
+                    }
+                }
+            }
 
         messages = [
-            {"role": "system", "content": prompt},
-            {"role": "user", "content": json.dumps(tasks)}
+            {"role": "system", "content": self.TASK_ANALYZER_PROMPT},
+            {"role": "user", "content": _dumps(tasks)}
         ]
 
-        response = await self.llm.agenerate(messages)
+        # Same tight output cap as calendar_analyzer: analyses are
+        # intermediate inputs to plan_generator, not user-facing text
+        response = await self.llm.agenerate(messages, max_tokens=384)
 
         return {
             "results": {
@@ -184,23 +315,43 @@ class PlannerAgent(ReActAgent):
         - Task analysis (what needs to be done)
         - Conversation history (previous context)
         """
-        profile_analysis = state["results"]["profile_analysis"]
-        calendar_analysis = state["results"]["calendar_analysis"]
-        task_analysis = state["results"]["task_analysis"]
-
-        # Build conversation context
-        conversation_context = []
-        for msg in state["messages"][:-1]:
-            if hasattr(msg, 'content'):
-                role = "User" if msg.__class__.__name__ == "HumanMessage" else "Assistant"
+        # Compact the upstream analyses before interpolation: each can be
+        # thousands of tokens of prose, all re-billed as input here
+        profile_analysis = self._compact(state["results"]["profile_analysis"])
+        calendar_analysis = self._compact(state["results"]["calendar_analysis"])
+        task_analysis = self._compact(state["results"]["task_analysis"])
+
+        # Reuse the conversation digest computed once in the coordinator;
+        # fall back to a local build only when the subgraph runs standalone
+        history_text = state["results"].get("history_text")
+        if history_text is None:
+            # Only the last 4 turns ever make it into the digest; slice
+            # before the loop so the work is O(1) in session length
+            conversation_context = []
+            for msg in state["messages"][-5:-1]:
+                # All BaseMessage subclasses carry .content; isinstance is
+                # a C-level check vs. the old class-name string compare
+                role = "User" if isinstance(msg, HumanMessage) else "Assistant"
                 content = msg.content[:400] + "..." if len(msg.content) > 400 else msg.content
                 conversation_context.append(f"{role}: {content}")
-
-        history_text = "\n".join(conversation_context[-4:]) if conversation_context else "This is the start of the conversation."
-
-        prompt = f"""AI Planning Assistant: Create focused study plan using ReACT framework.
-
-          INPUT CONTEXT:
+            history_text = "\n".join(conversation_context)
+        if not history_text:
+            history_text = "This is the start of the conversation."
+
+        # (Re-)register the static instruction block as a server-side
+        # cached prefix. The server deletes the cache at its TTL, so the
+        # handle is refreshed with a safety margin before the deadline
+        # rather than memoized once; when registration is unavailable the
+        # prefix is inlined as before and retried at the next deadline
+        now = time.monotonic()
+        if now >= self._plan_prefix_deadline:
+            self._plan_prefix = self.llm.prepare_cached_prefix(self._plan_system)
+            self._plan_prefix_deadline = now + max(
+                self.llm.CACHED_PREFIX_TTL_SECONDS - self.PREFIX_REFRESH_MARGIN_SECONDS,
+                self.PREFIX_REFRESH_MARGIN_SECONDS,
+            )
+
+        dynamic_context = f"""INPUT CONTEXT:
           - Profile Analysis: {profile_analysis}
           - Calendar Analysis: {calendar_analysis}
           - Task Analysis: {task_analysis}
@@ -208,50 +359,33 @@ class PlannerAgent(ReActAgent):
           CONVERSATION HISTORY:
           {history_text}
 
-          EXAMPLES:
-          {json.dumps(self.few_shot_examples, indent=2)}
-
-          INSTRUCTIONS:
-          1. Follow ReACT pattern:
-            Thought: Analyze situation and needs
-            Action: Consider all analyses
-            Observation: Synthesize findings
-            Plan: Create structured plan
-
-          2. Address:
-            - ADHD management strategies
-            - Energy level optimization
-            - Task chunking methods
-            - Focus period scheduling
-            - Environment switching tactics
-            - Recovery period planning
-            - Social/sport activity balance
-
-          3. Include:
-            - Emergency protocols
-            - Backup strategies
-            - Quick wins
-            - Reward system
-            - Progress tracking
-            - Adjustment triggers
-
-          4. If this is a follow-up question, reference and build upon the previous conversation context.
-
-          Pls act as an intelligent tool to help the students reach their goals or overcome struggles and answer with informal words.
-
-          FORMAT:
-          Thought: [reasoning and situation analysis]
-          Action: [synthesis approach]
-          Observation: [key findings]
-          Plan: [actionable steps and structural schedule]
-          """
-
-        messages = [
-            {"role": "system", "content": prompt},
-            {"role": "user", "content": state["messages"][-1].content}
-        ]
-
-        response = await self.llm.agenerate(messages, temperature=0.5)
+          REQUEST:
+          {state["messages"][-1].content}"""
+
+        response = None
+        if self._plan_prefix is not None:
+            # Only the dynamic suffix travels per request; the server
+            # replays its cached KV state for the static instructions
+            messages = [{"role": "user", "content": dynamic_context}]
+            try:
+                response = await self.llm.agenerate(
+                    messages, temperature=0.5, cached_content=self._plan_prefix,
+                    bypass_cache=True
+                )
+            except Exception:
+                # The server cache can lapse between the local deadline
+                # check and the call (clock skew, eviction); drop the
+                # handle and serve this request with the prefix inlined
+                self._plan_prefix = None
+                self._plan_prefix_deadline = 0.0
+
+        if response is None:
+            messages = [
+                {"role": "system", "content": self._plan_system},
+                {"role": "user", "content": dynamic_context}
+            ]
+            # The final plan is the creative step; always sample fresh
+            response = await self.llm.agenerate(messages, temperature=0.5, bypass_cache=True)
 
         return {
             "results": {
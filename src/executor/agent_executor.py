@@ -1,31 +1,38 @@
 """Agent Executor for orchestrating concurrent agent execution."""
 
 import asyncio
-from typing import Dict
+import logging
+from typing import Dict, Optional
 
 from src.state.academic_state import AcademicState
 from src.agents.planner import PlannerAgent
 from src.agents.notewriter import NoteWriterAgent
 from src.agents.advisor import AdvisorAgent
 
+logger = logging.getLogger(__name__)
+
 
 class AgentExecutor:
     """Orchestrates concurrent execution of multiple AI agents."""
 
-    def __init__(self, llm):
+    def __init__(self, llm, agents: Optional[Dict] = None):
         """
-        Initialize the executor with a language model and create agent instances.
+        Initialize the executor with a language model and agent instances.
 
         Args:
             llm: Language model instance to be used by all agents
+            agents: Optional pre-built mapping of agent name to instance;
+                when provided, the executor shares those instances instead
+                of constructing its own set
 
         Implementation Note:
-            - Creates a dictionary of specialized agents, each initialized with the same LLM
+            - By default creates a dictionary of specialized agents, each
+              initialized with the same LLM
             - Supports multiple agent types: PLANNER (default), NOTEWRITER, and ADVISOR
             - Agents are instantiated once and reused across executions
         """
         self.llm = llm
-        self.agents = {
+        self.agents = agents if agents is not None else {
             "PLANNER": PlannerAgent(llm),
             "NOTEWRITER": NoteWriterAgent(llm),
             "ADVISOR": AdvisorAgent(llm)
@@ -55,26 +62,45 @@ class AgentExecutor:
             required_agents = analysis.get("required_agents", ["PLANNER"])
             concurrent_groups = analysis.get("concurrent_groups", [])
 
+            # A missing or ill-formed grouping would otherwise serialize
+            # (or skip) execution; run all required agents concurrently
+            if not concurrent_groups:
+                concurrent_groups = [required_agents]
+
             # Initialize results container
             results = {}
 
             # Process each concurrent group sequentially
             for group in concurrent_groups:
-                # Prepare concurrent tasks for current group
+                # Prepare concurrent tasks for current group, tracking
+                # which agents actually run so results stay aligned
                 tasks = []
+                task_names = []
                 for agent_name in group:
                     # Validate agent availability and requirement
                     if agent_name in required_agents and agent_name in self.agents:
-                        tasks.append(self.agents[agent_name](state))
+                        # Isolate concurrent writers with structural sharing:
+                        # only the state dict and its "results" sub-dict are
+                        # shallow-copied, since "results" is the sole channel
+                        # agents write to. profile/calendar/tasks/messages are
+                        # treated as read-only by contract and shared as-is,
+                        # avoiding a deep copy of the full state per branch.
+                        branch_state = dict(state, results=dict(state["results"]))
+                        tasks.append(self.agents[agent_name](branch_state))
+                        task_names.append(agent_name)
 
                 # Execute group tasks concurrently if any exist
                 if tasks:
                     # Gather results from concurrent execution
                     group_results = await asyncio.gather(*tasks, return_exceptions=True)
 
-                    # Process successful results only
-                    for agent_name, result in zip(group, group_results):
-                        if not isinstance(result, Exception):
+                    # Keep successful results; log failures per agent so
+                    # one slow/broken agent doesn't silently force the
+                    # fallback path for the whole group
+                    for agent_name, result in zip(task_names, group_results):
+                        if isinstance(result, Exception):
+                            logger.warning("Agent %s failed: %s", agent_name, result)
+                        else:
                             results[agent_name.lower()] = result
 
             # Implement fallback strategy if no results were obtained
@@ -82,7 +108,9 @@ class AgentExecutor:
                 planner_result = await self.agents["PLANNER"](state)
                 results["planner"] = planner_result
 
-            print("agent_outputs", results)
+            # Lazy %s formatting: the results dict (full LLM outputs) is
+            # only stringified when a handler actually consumes DEBUG
+            logger.debug("agent_outputs=%s", results)
 
             # Return structured results
             return {
@@ -91,8 +119,8 @@ class AgentExecutor:
                 }
             }
 
-        except Exception as e:
-            print(f"Execution error: {e}")
+        except Exception:
+            logger.exception("Execution error")
             # Emergency fallback with minimal response
             return {
                 "results": {
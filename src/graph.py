@@ -1,17 +1,16 @@
 """Graph creation for the multi-agent workflow."""
 
+from functools import lru_cache, partial
 from typing import List
 
 from langgraph.graph import StateGraph, END, START
 
 from src.state.academic_state import AcademicState
-from src.agents.planner import PlannerAgent
-from src.agents.notewriter import NoteWriterAgent
-from src.agents.advisor import AdvisorAgent
-from src.agents.coordinator import coordinator_agent, profile_analyzer, set_llm
+from src.agents.coordinator import coordinator_agent, profile_analyzer
 from src.executor.agent_executor import AgentExecutor
 
 
+@lru_cache(maxsize=4)
 def create_agents_graph(llm) -> StateGraph:
     """Creates a coordinated workflow graph for multiple AI agents.
 
@@ -23,27 +22,33 @@ def create_agents_graph(llm) -> StateGraph:
     The workflow uses a state machine approach with conditional routing based on
     analysis of student needs.
 
+    The compiled graph is cached per llm instance: agent construction
+    and StateGraph.compile() are non-trivial, and a long-running session
+    invokes this once per user request.
+
     Args:
         llm: Language model instance shared across all agents
 
     Returns:
         StateGraph: Compiled workflow graph with parallel execution paths
     """
-    # Set the global LLM for coordinator functions
-    set_llm(llm)
-
     # Initialize main workflow state machine
     workflow = StateGraph(AcademicState)
 
-    # Create instances of our specialized agents
-    planner_agent = PlannerAgent(llm)
-    notewriter_agent = NoteWriterAgent(llm)
-    advisor_agent = AdvisorAgent(llm)
+    # The executor already owns one instance of each specialized agent;
+    # reuse those rather than constructing (and re-compiling the
+    # subgraphs of) a second set
     executor = AgentExecutor(llm)
+    planner_agent = executor.agents["PLANNER"]
+    notewriter_agent = executor.agents["NOTEWRITER"]
+    advisor_agent = executor.agents["ADVISOR"]
 
     # === MAIN WORKFLOW NODES ===
-    workflow.add_node("coordinator", coordinator_agent)
-    workflow.add_node("profile_analyzer", profile_analyzer)
+    # The llm is bound into the coordinator callables per graph; a module
+    # global would be rebound by whichever graph compiled last and leak
+    # one session's client into another's run
+    workflow.add_node("coordinator", partial(coordinator_agent, llm=llm))
+    workflow.add_node("profile_analyzer", partial(profile_analyzer, llm=llm))
     workflow.add_node("execute", executor.execute)
 
     # === PARALLEL EXECUTION ROUTING ===
@@ -64,13 +69,15 @@ def create_agents_graph(llm) -> StateGraph:
         next_nodes = []
 
         if "PLANNER" in required_agents:
+            # Calendar and task analysis are independent and fan out together
             next_nodes.append("calendar_analyzer")
+            next_nodes.append("task_analyzer")
         if "NOTEWRITER" in required_agents:
             next_nodes.append("notewriter_analyze")
         if "ADVISOR" in required_agents:
             next_nodes.append("advisor_analyze")
 
-        return next_nodes if next_nodes else ["calendar_analyzer"]
+        return next_nodes if next_nodes else ["calendar_analyzer", "task_analyzer"]
 
     # === AGENT SUBGRAPH NODES ===
     # Planner agent's workflow
@@ -94,11 +101,12 @@ def create_agents_graph(llm) -> StateGraph:
     workflow.add_conditional_edges(
         "profile_analyzer",
         route_to_parallel_agents,
-        ["calendar_analyzer", "notewriter_analyze", "advisor_analyze"]
+        ["calendar_analyzer", "task_analyzer", "notewriter_analyze", "advisor_analyze"]
     )
 
-    # Connect Planner agent's internal workflow
-    workflow.add_edge("calendar_analyzer", "task_analyzer")
+    # Connect Planner agent's internal workflow: both analyzers run
+    # concurrently and join at plan generation
+    workflow.add_edge("calendar_analyzer", "plan_generator")
     workflow.add_edge("task_analyzer", "plan_generator")
     workflow.add_edge("plan_generator", "execute")
 
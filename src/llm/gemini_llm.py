@@ -1,5 +1,7 @@
 """Gemini LLM wrapper for Google's Generative AI API."""
 
+import hashlib
+from collections import OrderedDict
 from typing import List, Dict, Optional
 import google.generativeai as genai
 
@@ -11,6 +13,26 @@ class GeminiLLM:
     A class to interact with Google's Gemini model through their API.
     """
 
+    # Minimum static-prefix size (in characters, ~4 chars per token) before
+    # server-side prompt caching is attempted; Gemini rejects CachedContent
+    # below a minimum token count and tiny prefixes are not worth a cache
+    CACHED_PREFIX_MIN_CHARS = 4096
+
+    # Server-side lifetime requested for CachedContent prefixes. Callers
+    # holding a prefix handle must re-register before this many seconds
+    # elapse; the server deletes the cache at the deadline and subsequent
+    # generate calls against the stale handle fail.
+    CACHED_PREFIX_TTL_SECONDS = 300
+
+    # Maximum number of responses kept in the in-memory request cache
+    RESPONSE_CACHE_SIZE = 128
+
+    # GenerativeModel instances shared across GeminiLLM objects, keyed by
+    # model name. The google.generativeai SDK owns the HTTP transport, so
+    # reusing the model object reuses its connection pool instead of
+    # re-negotiating TLS for every fresh GeminiLLM construction.
+    _shared_models: Dict[str, "genai.GenerativeModel"] = {}
+
     def __init__(self, api_key: str):
         """Initialize GeminiLLM with API key.
 
@@ -19,7 +41,22 @@ class GeminiLLM:
         """
         self.config = LLMConfig()
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(self.config.model)
+
+        model = self._shared_models.get(self.config.model)
+        if model is None:
+            model = genai.GenerativeModel(self.config.model)
+            self._shared_models[self.config.model] = model
+        self.model = model
+
+        # Optional async callback receiving partial token text as it is
+        # generated. When set, agenerate() switches to the streaming API
+        # and forwards each chunk before returning the assembled response.
+        self.token_sink = None
+
+        # LRU cache of responses keyed by (prompt, temperature) digest, so
+        # identical requests (repeated analyzer payloads, dev loops) skip
+        # the network round trip entirely
+        self._resp_cache: "OrderedDict[str, str]" = OrderedDict()
 
     def _convert_messages_to_prompt(self, messages: List[Dict]) -> str:
         """Convert messages to a single prompt string.
@@ -45,30 +82,161 @@ class GeminiLLM:
 
         return "\n\n".join(prompt_parts)
 
-    async def agenerate(
+    def _build_generation_config(
+        self,
+        temperature: Optional[float],
+        max_tokens: Optional[int] = None
+    ) -> "genai.GenerationConfig":
+        """Build a GenerationConfig from the given overrides and defaults.
+
+        Decode-token count dominates Gemini latency, so callers producing
+        short intermediate output (the analyzers) pass a tighter
+        max_tokens than the config default used for final generation.
+        """
+        return genai.GenerationConfig(
+            temperature=temperature or self.config.default_temp,
+            max_output_tokens=max_tokens or self.config.max_tokens,
+            candidate_count=1
+        )
+
+    def prepare_cached_prefix(
+        self, system_text: str, ttl_seconds: int = CACHED_PREFIX_TTL_SECONDS
+    ):
+        """Register a static system prompt as server-side cached content.
+
+        Gemini then reuses the prefix's server-side KV cache across calls,
+        so only the dynamic suffix is re-processed per request. Returns
+        None when the prefix is too short to be cacheable or the caching
+        API is unavailable, in which case callers should send the prefix
+        inline as usual. The handle is only valid for ttl_seconds; callers
+        keeping one across calls must re-register before it lapses.
+
+        Args:
+            system_text: The invariant system prompt text
+            ttl_seconds: Server-side cache lifetime in seconds
+
+        Returns:
+            CachedContent handle to pass to agenerate(), or None
+        """
+        if len(system_text) < self.CACHED_PREFIX_MIN_CHARS:
+            return None
+        try:
+            return genai.caching.CachedContent.create(
+                model=self.config.model,
+                system_instruction=system_text,
+                ttl=f"{ttl_seconds}s"
+            )
+        except Exception:
+            # Caching is a pure optimization; any failure (unsupported
+            # model, prefix below the server's token minimum) falls back
+            # to inlining the prefix
+            return None
+
+    def _resolve_model(self, cached_content) -> "genai.GenerativeModel":
+        """Return the model to generate with, honoring a cached prefix."""
+        if cached_content is not None:
+            return genai.GenerativeModel.from_cached_content(cached_content)
+        return self.model
+
+    async def astream(
         self,
         messages: List[Dict],
-        temperature: Optional[float] = None
-    ) -> str:
-        """Generate text using Gemini model.
+        temperature: Optional[float] = None,
+        cached_content=None,
+        max_tokens: Optional[int] = None
+    ):
+        """Stream generated text from the Gemini model chunk by chunk.
 
         Args:
             messages: List of message dicts with 'role' and 'content'
             temperature: Sampling temperature (0.0 to 1.0, default from config)
+            cached_content: Optional CachedContent prefix handle
+            max_tokens: Optional per-call output-token cap
 
-        Returns:
-            str: Generated text response
+        Yields:
+            str: Partial text chunks as they are generated
         """
         prompt = self._convert_messages_to_prompt(messages)
 
-        generation_config = genai.GenerationConfig(
-            temperature=temperature or self.config.default_temp,
-            max_output_tokens=self.config.max_tokens
-        )
-
-        response = await self.model.generate_content_async(
+        response = await self._resolve_model(cached_content).generate_content_async(
             prompt,
-            generation_config=generation_config
+            generation_config=self._build_generation_config(temperature, max_tokens),
+            stream=True
         )
 
-        return response.text
+        async for chunk in response:
+            if chunk.text:
+                yield chunk.text
+
+    def _cache_key(
+        self,
+        messages: List[Dict],
+        temperature: Optional[float],
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Digest of the effective prompt and sampling knobs for the response cache."""
+        prompt = self._convert_messages_to_prompt(messages)
+        temp = temperature or self.config.default_temp
+        limit = max_tokens or self.config.max_tokens
+        return hashlib.blake2b(f"{prompt}\x00{temp}\x00{limit}".encode()).hexdigest()
+
+    def _cache_store(self, key: str, response: str) -> None:
+        """Insert a response into the LRU cache, evicting the oldest entry."""
+        self._resp_cache[key] = response
+        if len(self._resp_cache) > self.RESPONSE_CACHE_SIZE:
+            self._resp_cache.popitem(last=False)
+
+    async def agenerate(
+        self,
+        messages: List[Dict],
+        temperature: Optional[float] = None,
+        cached_content=None,
+        bypass_cache: bool = False,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate text using Gemini model.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature (0.0 to 1.0, default from config)
+            cached_content: Optional CachedContent prefix handle; when set,
+                only the dynamic messages are sent and the server reuses
+                the cached static prefix
+            bypass_cache: Skip the response cache; intended for creative
+                calls where a fresh sample is wanted even on repeat input
+            max_tokens: Optional per-call output-token cap; defaults to
+                the config-wide limit
+
+        Returns:
+            str: Generated text response
+        """
+        key = None
+        if not bypass_cache:
+            key = self._cache_key(messages, temperature, max_tokens)
+            cached = self._resp_cache.get(key)
+            if cached is not None:
+                self._resp_cache.move_to_end(key)
+                if self.token_sink is not None:
+                    await self.token_sink(cached)
+                return cached
+
+        if self.token_sink is not None:
+            # Streaming path: forward partial tokens to the sink while
+            # assembling the full response for the caller
+            parts = []
+            async for text in self.astream(messages, temperature, cached_content, max_tokens):
+                parts.append(text)
+                await self.token_sink(text)
+            response_text = "".join(parts)
+        else:
+            prompt = self._convert_messages_to_prompt(messages)
+
+            response = await self._resolve_model(cached_content).generate_content_async(
+                prompt,
+                generation_config=self._build_generation_config(temperature, max_tokens)
+            )
+            response_text = response.text
+
+        if key is not None:
+            self._cache_store(key, response_text)
+        return response_text
@@ -4,28 +4,42 @@ import os
 import re
 import json
 import asyncio
-import traceback
+import logging
+from functools import lru_cache
 
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
+from rich.text import Text
 from langchain_core.messages import HumanMessage
 
 from src.llm import GeminiLLM
 from src.utils.data_manager import DataManager
 from src.graph import create_agents_graph
 
+logger = logging.getLogger(__name__)
 
-async def run_all_system(profile_json: str, calendar_json: str, task_json: str):
+
+@lru_cache(maxsize=1)
+def _get_llm(api_key: str) -> GeminiLLM:
+    """Return the shared Gemini client, constructed once per API key.
+
+    Reusing the same llm instance across run_all_system calls lets
+    create_agents_graph's cache hit, so the workflow graph is compiled
+    once per session instead of once per request.
+    """
+    return GeminiLLM(api_key)
+
+
+async def run_all_system(dm: DataManager):
     """Run the entire academic assistance system with improved output handling.
 
     This is the main entry point for the ATLAS (Academic Task Learning Agent System).
     It handles initialization, user interaction, workflow execution, and result presentation.
 
     Args:
-        profile_json: JSON string containing student profile data
-        calendar_json: JSON string containing calendar/schedule data
-        task_json: JSON string containing academic tasks data
+        dm: DataManager with profile, calendar and task data already loaded
 
     Returns:
         Tuple[Dict, Dict]: Coordinator output and final state, or (None, None) on error
@@ -43,11 +57,7 @@ async def run_all_system(profile_json: str, calendar_json: str, task_json: str):
             return None, None
 
         # Initialize core system components
-        llm = GeminiLLM(api_key)
-
-        # DataManager handles all data loading and access
-        dm = DataManager()
-        dm.load_data(profile_json, calendar_json, task_json)
+        llm = _get_llm(api_key)
 
         # Get user request
         console.print("[bold green]Please enter your academic request:[/bold green]")
@@ -63,7 +73,8 @@ async def run_all_system(profile_json: str, calendar_json: str, task_json: str):
             "results": {}
         }
 
-        # Initialize workflow graph for agent orchestration
+        # Workflow graph for agent orchestration; cached per llm, so
+        # repeated requests in a session reuse the compiled graph
         graph = create_agents_graph(llm)
 
         console.print("[bold cyan]System initialized and processing request...[/bold cyan]\n")
@@ -72,19 +83,32 @@ async def run_all_system(profile_json: str, calendar_json: str, task_json: str):
         coordinator_output = None
         final_state = None
 
-        # Process workflow with live status updates
-        with console.status("[bold green]Processing...", spinner="dots") as status:
-            async for step in graph.astream(state):
-                if "coordinator_analysis" in step.get("results", {}):
-                    coordinator_output = step
-                    analysis = coordinator_output["results"]["coordinator_analysis"]
+        # Stream partial tokens into a live console view while the
+        # workflow runs, instead of sitting on a spinner until the last
+        # LLM call completes
+        streamed = Text()
+
+        async def print_token(text: str):
+            streamed.append(text)
+
+        with Live(streamed, console=console, refresh_per_second=15, transient=True):
+            llm.token_sink = print_token
+            try:
+                async for step in graph.astream(state):
+                    if "coordinator_analysis" in step.get("results", {}):
+                        coordinator_output = step
 
-                    console.print("\n[bold cyan]Selected Agents:[/bold cyan]")
-                    for agent in analysis.get("required_agents", []):
-                        console.print(f"  - {agent}")
+                    if "execute" in step:
+                        final_state = step
+            finally:
+                llm.token_sink = None
 
-                if "execute" in step:
-                    final_state = step
+        if coordinator_output:
+            analysis = coordinator_output["results"]["coordinator_analysis"]
+
+            console.print("\n[bold cyan]Selected Agents:[/bold cyan]")
+            for agent in analysis.get("required_agents", []):
+                console.print(f"  - {agent}")
 
         # Display results
         if final_state:
@@ -110,8 +134,8 @@ async def run_all_system(profile_json: str, calendar_json: str, task_json: str):
     except Exception as e:
         console = Console()
         console.print(f"\n[bold red]System error:[/bold red] {str(e)}")
-        console.print("[yellow]Stack trace:[/yellow]")
-        console.print(traceback.format_exc())
+        # logger.exception defers traceback formatting to the handler
+        logger.exception("System error")
         return None, None
 
 
@@ -131,25 +155,23 @@ async def load_json_and_run(profile_path: str, calendar_path: str, task_path: st
     console.print("-" * 50)
 
     try:
-        # Load JSON files
-        with open(profile_path, 'r', encoding='utf-8') as f:
-            profile_json = f.read()
-        with open(calendar_path, 'r', encoding='utf-8') as f:
-            calendar_json = f.read()
-        with open(task_path, 'r', encoding='utf-8') as f:
-            task_json = f.read()
+        # DataManager handles all data loading and access; calendar and
+        # tasks go through its streaming loaders, so large files are
+        # decoded incrementally instead of being slurped whole
+        dm = DataManager()
+        dm.load_files(profile_path, calendar_path, task_path)
 
         console.print("\nFiles loaded successfully!")
         console.print("\nStarting academic assistance workflow...")
 
-        return await run_all_system(profile_json, calendar_json, task_json)
+        return await run_all_system(dm)
 
     except FileNotFoundError as e:
         console.print(f"\n[bold red]Error: File not found - {e}[/bold red]")
         return None, None
     except Exception as e:
         console.print(f"\n[bold red]Error: {str(e)}[/bold red]")
-        console.print(traceback.format_exc())
+        logger.exception("Setup error")
         return None, None
 
 
@@ -1,5 +1,23 @@
 """Models module for agent data structures."""
 
-from .agent_models import AgentAction, AgentOutput
+from .agent_models import (
+    AdviceOutput,
+    AgentAction,
+    AgentOutput,
+    AgentResult,
+    NoteOutput,
+    PlanOutput,
+    parse_agent_action,
+    parse_agent_output,
+)
 
-__all__ = ["AgentAction", "AgentOutput"]
+__all__ = [
+    "AdviceOutput",
+    "AgentAction",
+    "AgentOutput",
+    "AgentResult",
+    "NoteOutput",
+    "PlanOutput",
+    "parse_agent_action",
+    "parse_agent_output",
+]
@@ -1,49 +1,162 @@
-"""Pydantic models for agent actions and outputs."""
-
-from typing import Dict, Optional
-from pydantic import BaseModel
-
-
-class AgentAction(BaseModel):
-    """
-    Model representing an agent's action decision.
-
-    Attributes:
-        action (str): The specific action to be taken (e.g., "search_calendar", "analyze_tasks")
-        thought (str): The reasoning process behind the action choice
-        tool (Optional[str]): The specific tool to be used for the action (if needed)
-        action_input (Optional[Dict]): Input parameters for the action
-
-    Example:
-        >>> action = AgentAction(
-        ...     action="search_calendar",
-        ...     thought="Need to check schedule conflicts",
-        ...     tool="calendar_search",
-        ...     action_input={"date_range": "next_week"}
-        ... )
-    """
-    action: str
-    thought: str
-    tool: Optional[str] = None
-    action_input: Optional[Dict] = None
-
-
-class AgentOutput(BaseModel):
-    """
-    Model representing the output from an agent's action.
-
-    Attributes:
-        observation (str): The result or observation from executing the action
-        output (Dict): Structured output data from the action
-
-    Example:
-        >>> output = AgentOutput(
-        ...     observation="Found 3 free time slots next week",
-        ...     output={
-        ...         "free_slots": ["Mon 2PM", "Wed 10AM", "Fri 3PM"],
-        ...         "conflicts": []
-        ...     }
-        ... )
-    """
-    observation: str
-    output: Dict
+"""Models for agent actions and outputs.
+
+When msgspec is installed the models are defined as ``msgspec.Struct``
+types: construction runs on a C-level path, instances are slotted (no
+per-instance ``__dict__``), and invalid data is rejected far faster
+than BaseModel validation. Without msgspec the original Pydantic
+models are used, so the public names and field layout are identical
+either way.
+"""
+
+from typing import Annotated, Dict, Literal, Optional, Union
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+if msgspec is not None:
+    class AgentAction(msgspec.Struct, frozen=True):
+        """An agent's action decision.
+
+        Attributes:
+            action (str): The specific action to be taken (e.g., "search_calendar")
+            thought (str): The reasoning process behind the action choice
+            tool (Optional[str]): The specific tool to be used for the action (if needed)
+            action_input (Optional[Dict]): Input parameters for the action
+        """
+        action: str
+        thought: str
+        tool: Optional[str] = None
+        action_input: Optional[Dict] = None
+
+    class PlanOutput(msgspec.Struct, tag_field="kind", tag="plan", frozen=True):
+        """A study plan produced by the planner agent."""
+        plan: str
+
+    class NoteOutput(msgspec.Struct, tag_field="kind", tag="notes", frozen=True):
+        """Study notes produced by the notewriter agent."""
+        notes: str
+
+    class AdviceOutput(msgspec.Struct, tag_field="kind", tag="advice", frozen=True):
+        """Guidance produced by the advisor agent."""
+        advice: str
+
+    # Tagged union: the decoder dispatches on the "kind" field in O(1)
+    # instead of trying each variant in sequence
+    AgentResult = Union[PlanOutput, NoteOutput, AdviceOutput]
+
+    class AgentOutput(msgspec.Struct, frozen=True):
+        """The output from an agent's action.
+
+        Attributes:
+            observation (str): The result or observation from executing the action
+            output (AgentResult): Structured payload, discriminated by its "kind" tag
+        """
+        observation: str
+        output: AgentResult
+
+    # Typed JSON decoders built once at module load; every parse reuses
+    # the same C-level decoder instead of re-deriving the schema
+    _action_decoder = msgspec.json.Decoder(AgentAction)
+    _output_decoder = msgspec.json.Decoder(AgentOutput)
+
+    def parse_agent_action(payload) -> AgentAction:
+        """Parse a JSON payload into an AgentAction via the shared decoder."""
+        return _action_decoder.decode(payload)
+
+    def parse_agent_output(payload) -> AgentOutput:
+        """Parse a JSON payload into an AgentOutput via the shared decoder."""
+        return _output_decoder.decode(payload)
+
+else:
+    from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+    class AgentAction(BaseModel):
+        """
+        Model representing an agent's action decision.
+
+        Attributes:
+            action (str): The specific action to be taken (e.g., "search_calendar", "analyze_tasks")
+            thought (str): The reasoning process behind the action choice
+            tool (Optional[str]): The specific tool to be used for the action (if needed)
+            action_input (Optional[Dict]): Input parameters for the action
+
+        Example:
+            >>> action = AgentAction(
+            ...     action="search_calendar",
+            ...     thought="Need to check schedule conflicts",
+            ...     tool="calendar_search",
+            ...     action_input={"date_range": "next_week"}
+            ... )
+        """
+        # extra='forbid' lets pydantic-core fast-reject unknown keys
+        # without building an extras dict; frozen matches the msgspec
+        # branch and skips assignment re-validation machinery
+        model_config = ConfigDict(extra="forbid", frozen=True)
+
+        action: str
+        thought: str
+        tool: Optional[str] = None
+        action_input: Optional[Dict] = None
+
+    class PlanOutput(BaseModel):
+        """A study plan produced by the planner agent."""
+        model_config = ConfigDict(extra="forbid", frozen=True)
+
+        kind: Literal["plan"] = "plan"
+        plan: str
+
+    class NoteOutput(BaseModel):
+        """Study notes produced by the notewriter agent."""
+        model_config = ConfigDict(extra="forbid", frozen=True)
+
+        kind: Literal["notes"] = "notes"
+        notes: str
+
+    class AdviceOutput(BaseModel):
+        """Guidance produced by the advisor agent."""
+        model_config = ConfigDict(extra="forbid", frozen=True)
+
+        kind: Literal["advice"] = "advice"
+        advice: str
+
+    # Discriminated union: pydantic-core dispatches on the "kind" tag
+    # in O(1) instead of trying each variant in sequence
+    AgentResult = Annotated[
+        Union[PlanOutput, NoteOutput, AdviceOutput],
+        Field(discriminator="kind"),
+    ]
+
+    class AgentOutput(BaseModel):
+        """
+        Model representing the output from an agent's action.
+
+        Attributes:
+            observation (str): The result or observation from executing the action
+            output (AgentResult): Structured payload, discriminated by its "kind" tag
+
+        Example:
+            >>> output = AgentOutput(
+            ...     observation="Generated a week-by-week study plan",
+            ...     output={"kind": "plan", "plan": "WEEK 1: ..."}
+            ... )
+        """
+        model_config = ConfigDict(extra="forbid", frozen=True)
+
+        observation: str
+        output: AgentResult
+
+    # Prebuilt TypeAdapters: the Rust-side schema validator is
+    # constructed exactly once per process instead of per parse
+    AgentAction_adapter = TypeAdapter(AgentAction)
+    AgentOutput_adapter = TypeAdapter(AgentOutput)
+
+    def parse_agent_action(payload) -> AgentAction:
+        """Parse a JSON payload into an AgentAction via the shared adapter."""
+        return AgentAction_adapter.validate_json(payload)
+
+    def parse_agent_output(payload) -> AgentOutput:
+        """Parse a JSON payload into an AgentOutput via the shared adapter."""
+        return AgentOutput_adapter.validate_json(payload)
@@ -5,12 +5,43 @@ from operator import add
 
 from langchain_core.messages import BaseMessage
 
-from src.utils.reducers import dict_reducer
+from src.utils.reducers import make_channel_reducer
+
+# The results channel has a fixed vocabulary of top-level keys — one per
+# agent stage plus the shared history digest — so its reducer is
+# generated once at import with the merge strategy for each key inlined
+# as straight-line code (unknown keys still merge generically).
+results_reducer = make_channel_reducer({
+    "coordinator_analysis": "merge",
+    "profile_analysis": "merge",
+    "calendar_analysis": "merge",
+    "task_analysis": "merge",
+    "learning_analysis": "merge",
+    "performance_analysis": "merge",
+    "situation_analysis": "merge",
+    "generated_notes": "merge",
+    "guidance": "merge",
+    "final_plan": "merge",
+    "agent_outputs": "merge",
+    "history_text": "replace",
+})
 
 
 class AcademicState(TypedDict):
     """Master state container for the academic assistance system.
 
+    By contract, agents treat profile/calendar/tasks as read-only inputs
+    and report back only through the results channel (as partial dicts
+    merged by the reducer), which lets concurrent branches share those
+    inputs without copying.
+
+    Channel semantics follow that contract: profile, calendar and tasks
+    are written once by the loader and never merged, so they use
+    LangGraph's default last-write-wins channel — running the recursive
+    merge over the largest subtrees on every checkpoint write bought
+    nothing. Only results, which genuinely accumulates partial updates
+    from concurrent agents, keeps the merging reducer.
+
     Attributes:
         messages: Conversation history with the student
         profile: Student information and preferences
@@ -19,7 +50,7 @@ class AcademicState(TypedDict):
         results: Operation outputs from agents
     """
     messages: Annotated[List[BaseMessage], add]
-    profile: Annotated[Dict, dict_reducer]
-    calendar: Annotated[Dict, dict_reducer]
-    tasks: Annotated[Dict, dict_reducer]
-    results: Annotated[Dict[str, Any], dict_reducer]
+    profile: Dict
+    calendar: Dict
+    tasks: Dict
+    results: Annotated[Dict[str, Any], results_reducer]
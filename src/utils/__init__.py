@@ -1,12 +1,16 @@
 """Utility functions module."""
 
-from .reducers import dict_reducer
+from .reducers import dict_reducer, make_channel_reducer
 from .data_manager import DataManager
-from .context import analyze_context, parse_coordinator_response
+from .context import analyze_context, build_history_text, parse_coordinator_response
+from .serialization import dumps_cached
 
 __all__ = [
     "dict_reducer",
+    "make_channel_reducer",
     "DataManager",
     "analyze_context",
-    "parse_coordinator_response"
+    "build_history_text",
+    "parse_coordinator_response",
+    "dumps_cached"
 ]
@@ -1,11 +1,116 @@
 """Context analysis utilities for coordinator decision-making."""
 
-import json
-from typing import Dict, TYPE_CHECKING
+import re
+from types import MappingProxyType
+from typing import Dict, Tuple, TYPE_CHECKING
+
+from langchain_core.messages import HumanMessage
+
+# Shared read-only fallback for .get() chains, so misses do not allocate
+# a fresh dict per lookup. Never returned inside JSON-serialized payloads.
+_EMPTY = MappingProxyType({})
 
 if TYPE_CHECKING:
     from src.state.academic_state import AcademicState
 
+# Compiled course-name matchers keyed by the identity of the course list
+# they were built from. A single alternation pattern scans the request
+# once regardless of catalog size, instead of one substring probe (and
+# one .lower() call) per course per turn. Each entry pins the course
+# list it was built from, so its id cannot be recycled onto a different
+# list while the entry lives; hits verify identity as well. Bounded:
+# profiles are few and long-lived, so the cache is cleared rather than
+# LRU-evicted on the rare overflow.
+_COURSE_MATCHERS: Dict[int, Tuple[list, "re.Pattern", Dict]] = {}
+_COURSE_MATCHER_LIMIT = 8
+
+# All coordinator-response probes fused into one pattern so the response
+# is traversed once, instead of up to six `in` scans plus a full
+# .lower() copy per parse. Groups are kept independent (rather than a
+# combined "Thought:...Decision:" span) so agent mentions inside the
+# reasoning text are still seen.
+_COORDINATOR_PAT = re.compile(
+    r"(?P<thought>Thought:)"
+    r"|(?P<decision>Decision:)"
+    r"|(?P<notewriter>NOTEWRITER|note)"
+    r"|(?P<advisor>ADVISOR|guidance)",
+    re.IGNORECASE,
+)
+
+# Agent-selection templates indexed by a detection bitmask, replacing
+# the chain of append/assign branches on unpredictable LLM output. The
+# templates hold immutable tuples; each parse materializes fresh lists
+# and dicts from them so downstream mutation cannot corrupt the table.
+_NOTEWRITER_BIT = 1
+_ADVISOR_BIT = 2
+_TEMPLATES = (
+    {   # 0: planner only (also the non-ReACT default)
+        "required_agents": ("PLANNER",),
+        "priority": (("PLANNER", 1),),
+        "concurrent_groups": (("PLANNER",),),
+    },
+    {   # NOTEWRITER
+        "required_agents": ("PLANNER", "NOTEWRITER"),
+        "priority": (("PLANNER", 1), ("NOTEWRITER", 2)),
+        "concurrent_groups": (("PLANNER", "NOTEWRITER"),),
+    },
+    {   # ADVISOR
+        "required_agents": ("PLANNER", "ADVISOR"),
+        "priority": (("PLANNER", 1), ("ADVISOR", 3)),
+        "concurrent_groups": (("PLANNER",),),
+    },
+    {   # NOTEWRITER | ADVISOR
+        "required_agents": ("PLANNER", "NOTEWRITER", "ADVISOR"),
+        "priority": (("PLANNER", 1), ("NOTEWRITER", 2), ("ADVISOR", 3)),
+        "concurrent_groups": (("PLANNER", "NOTEWRITER"),),
+    },
+)
+
+
+def _course_matcher(courses) -> Tuple["re.Pattern", Dict]:
+    """Return (pattern, name->course map) for a profile's course list.
+
+    Longer names are tried first so "Advanced Calculus" wins over
+    "Calculus" when both are enrolled.
+    """
+    key = id(courses)
+    cached = _COURSE_MATCHERS.get(key)
+    if cached is not None and cached[0] is courses:
+        return cached[1], cached[2]
+
+    by_name = {course["name"].lower(): course for course in courses}
+    names = sorted(by_name, key=len, reverse=True)
+    pattern = re.compile("|".join(map(re.escape, names)))
+
+    if len(_COURSE_MATCHERS) >= _COURSE_MATCHER_LIMIT:
+        _COURSE_MATCHERS.clear()
+    _COURSE_MATCHERS[key] = (courses, pattern, by_name)
+    return pattern, by_name
+
+
+def build_history_text(messages, max_msgs: int = 4, truncate: int = 400) -> str:
+    """Render recent conversation history as a compact plain-text digest.
+
+    Built once per turn (in the coordinator node) and shared through
+    `state["results"]["history_text"]` so each agent does not re-walk and
+    re-truncate the full message list.
+
+    Args:
+        messages: Full message list; the last entry (current request) is excluded
+        max_msgs: Number of most recent history entries to keep
+        truncate: Maximum characters kept per message
+
+    Returns:
+        str: Newline-joined "Role: content" lines, empty if no history
+    """
+    lines = []
+    for msg in messages[:-1]:
+        if hasattr(msg, 'content'):
+            role = "User" if isinstance(msg, HumanMessage) else "Assistant"
+            content = msg.content[:truncate] + "..." if len(msg.content) > truncate else msg.content
+            lines.append(f"{role}: {content}")
+    return "\n".join(lines[-max_msgs:])
+
 
 async def analyze_context(state: "AcademicState") -> Dict:
     """
@@ -28,35 +133,43 @@ async def analyze_context(state: "AcademicState") -> Dict:
         - Identifies current course context from the latest message content
         - Provides default values for missing information to ensure stability
     """
-    # Extract main data components with safe navigation
-    profile = state.get("profile", {})
-    calendar = state.get("calendar", {})
-    tasks = state.get("tasks", {})
+    # Extract main data components with safe navigation, resolving each
+    # nested section once instead of re-chaining .get() per field
+    profile = state.get("profile") or _EMPTY
+    calendar = state.get("calendar") or _EMPTY
+    tasks = state.get("tasks") or _EMPTY
+
+    personal = profile.get("personal_info", _EMPTY)
+    prefs = profile.get("learning_preferences", _EMPTY)
 
     # Extract course information and match with current request
-    courses = profile.get("academic_info", {}).get("current_courses", [])
+    courses = profile.get("academic_info", _EMPTY).get("current_courses", [])
     current_course = None
     request = state["messages"][-1].content.lower()
 
-    # Identify relevant course from request content
-    for course in courses:
-        if course["name"].lower() in request:
-            current_course = course
-            break
+    # Identify relevant course with one pass over the request via the
+    # precompiled multi-pattern matcher
+    if courses:
+        pattern, by_name = _course_matcher(courses)
+        match = pattern.search(request)
+        if match:
+            current_course = by_name[match.group(0)]
 
     # Construct comprehensive context analysis
-    return {
+    analysis = {
         "student": {
-            "major": profile.get("personal_info", {}).get("major", "Unknown"),
-            "year": profile.get("personal_info", {}).get("academic_year"),
-            "learning_style": profile.get("learning_preferences", {}).get("learning_style", {}),
+            "major": personal.get("major", "Unknown"),
+            "year": personal.get("academic_year"),
+            "learning_style": prefs.get("learning_style", {}),
         },
         "course": current_course,
         "upcoming_events": len(calendar.get("events", [])),
         "active_tasks": len(tasks.get("tasks", [])),
-        "study_patterns": profile.get("learning_preferences", {}).get("study_patterns", {})
+        "study_patterns": prefs.get("study_patterns", {})
     }
 
+    return analysis
+
 
 def parse_coordinator_response(response: str) -> Dict:
     """
@@ -79,29 +192,39 @@ def parse_coordinator_response(response: str) -> Dict:
             - reasoning: Extracted reasoning for decisions
     """
     try:
-        # Initialize with safe default configuration
-        analysis = {
-            "required_agents": ["PLANNER"],
-            "priority": {"PLANNER": 1},
-            "concurrent_groups": [["PLANNER"]],
+        # Single pass over the response: each probe sets its flag the
+        # first time it matches
+        has_thought = has_decision = wants_notewriter = wants_advisor = False
+        for match in _COORDINATOR_PAT.finditer(response):
+            group = match.lastgroup
+            if group == "thought":
+                has_thought = True
+            elif group == "decision":
+                has_decision = True
+            elif group == "notewriter":
+                wants_notewriter = True
+            else:
+                wants_advisor = True
+            if has_thought and has_decision and wants_notewriter and wants_advisor:
+                break
+
+        # Advanced coordination only applies when the ReACT pattern is
+        # present; otherwise the default planner-only template is used
+        mask = 0
+        if has_thought and has_decision:
+            if wants_notewriter:
+                mask |= _NOTEWRITER_BIT
+            if wants_advisor:
+                mask |= _ADVISOR_BIT
+
+        template = _TEMPLATES[mask]
+        return {
+            "required_agents": list(template["required_agents"]),
+            "priority": dict(template["priority"]),
+            "concurrent_groups": [list(group) for group in template["concurrent_groups"]],
             "reasoning": response
         }
 
-        # Parse ReACT patterns for advanced coordination
-        if "Thought:" in response and "Decision:" in response:
-            # Check for NOTEWRITER requirements
-            if "NOTEWRITER" in response or "note" in response.lower():
-                analysis["required_agents"].append("NOTEWRITER")
-                analysis["priority"]["NOTEWRITER"] = 2
-                analysis["concurrent_groups"] = [["PLANNER", "NOTEWRITER"]]
-
-            # Check for ADVISOR requirements
-            if "ADVISOR" in response or "guidance" in response.lower():
-                analysis["required_agents"].append("ADVISOR")
-                analysis["priority"]["ADVISOR"] = 3
-
-        return analysis
-
     except Exception as e:
         print(f"Parse error: {str(e)}")
         return {
@@ -1,9 +1,50 @@
 """Data management utilities for loading and accessing academic data."""
 
 import json
+import logging
+import sys
+from bisect import bisect_left, bisect_right
 from typing import Dict, List
 from datetime import datetime, timezone, timedelta
 
+try:
+    # Rust/SIMD JSON parser, 2-5x faster than stdlib on nested documents
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    # C-extension parser: handles Z-suffixed RFC3339 directly, with no
+    # intermediate string allocation per call
+    from ciso8601 import parse_rfc3339 as _parse_rfc3339
+except ImportError:
+    _parse_rfc3339 = None
+
+try:
+    # Streaming JSON decoder: yields events one at a time so large
+    # calendars never materialize fully in memory
+    import ijson
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# Interned once; with task statuses interned at load, the per-task
+# status compare in get_active_tasks hits CPython's identity fast path
+_NEEDS_ACTION = sys.intern("needsAction")
+
+
+def _py_parse(dt_str: str) -> datetime:
+    """Stdlib datetime parsing, normalized to UTC (fallback path)."""
+    try:
+        # First attempt: Parse ISO format with timezone
+        dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
+        return dt.astimezone(timezone.utc)
+    except ValueError:
+        # Fallback: Assume UTC if no timezone provided
+        dt = datetime.fromisoformat(dt_str)
+        return dt.replace(tzinfo=timezone.utc)
+
 
 class DataManager:
     """Manages loading and accessing student profile, calendar, and task data."""
@@ -16,6 +57,11 @@ class DataManager:
         self.profile_data = None
         self.calendar_data = None
         self.task_data = None
+        self._profile_by_id = {}
+        self._event_starts = None
+        self._events_by_start = None
+        self._task_due = None
+        self._task_refs = None
 
     def load_data(self, profile_json: str, calendar_json: str, task_json: str):
         """
@@ -28,9 +74,170 @@ class DataManager:
 
         Note: This method expects valid JSON strings. Any parsing errors will propagate up.
         """
-        self.profile_data = json.loads(profile_json)
-        self.calendar_data = json.loads(calendar_json)
-        self.task_data = json.loads(task_json)
+        self.profile_data = _loads(profile_json)
+        self.calendar_data = _loads(calendar_json)
+        self.task_data = _loads(task_json)
+
+        # Index profiles by id once so lookups are O(1) instead of a
+        # linear scan per request
+        self._profile_by_id = {
+            p["id"]: p for p in self.profile_data.get("profiles", [])
+        }
+
+        # JSON-decoded strings are not interned; interning statuses here
+        # makes the hot-loop equality check a pointer comparison
+        for task in self.task_data.get("tasks", []):
+            status = task.get("status")
+            if type(status) is str:
+                task["status"] = sys.intern(status)
+
+        self._index_events()
+        self._index_tasks()
+
+    def load_files(self, profile_path: str, calendar_path: str, task_path: str):
+        """
+        Load the three data sources from files on disk.
+
+        The profile is small and parsed whole; calendar and tasks go
+        through the streaming loaders, so with ijson installed one
+        record at a time is resident during the load and fields the
+        pipeline never reads are dropped at the parser.
+
+        Args:
+            profile_path (str): Path to the profile JSON file
+            calendar_path (str): Path to the calendar JSON file
+            task_path (str): Path to the tasks JSON file
+        """
+        with open(profile_path, 'r', encoding='utf-8') as f:
+            self.profile_data = _loads(f.read())
+        self._profile_by_id = {
+            p["id"]: p for p in self.profile_data.get("profiles", [])
+        }
+        self.load_calendar_streaming(calendar_path)
+        self.load_tasks_streaming(task_path)
+
+    # Event fields the pipeline actually reads; everything else
+    # (attendees, descriptions, recurrence rules) is dead weight in both
+    # the calendar cache and the analyzer prompts
+    _EVENT_FIELDS = ("id", "summary", "start", "end", "location", "status")
+
+    def load_calendar_streaming(self, calendar_path: str):
+        """
+        Load calendar events from a file, keeping only the fields the
+        pipeline reads.
+
+        With ijson installed the document is decoded incrementally, so
+        one event at a time is resident during the load and the dropped
+        fields never materialize; otherwise the file is parsed whole and
+        projected down to the same field set.
+
+        Args:
+            calendar_path (str): Path to the calendar JSON file
+        """
+        fields = self._EVENT_FIELDS
+        events = []
+        _append = events.append
+
+        if ijson is not None:
+            with open(calendar_path, 'rb') as f:
+                for event in ijson.items(f, "events.item"):
+                    _append({k: event[k] for k in fields if k in event})
+        else:
+            with open(calendar_path, 'r', encoding='utf-8') as f:
+                data = _loads(f.read())
+            for event in data.get("events", []):
+                _append({k: event[k] for k in fields if k in event})
+
+        self.calendar_data = {"events": events}
+        self._index_events()
+
+    # Task fields the pipeline actually reads, mirroring _EVENT_FIELDS
+    _TASK_FIELDS = ("id", "title", "due", "status", "priority", "notes")
+
+    def load_tasks_streaming(self, task_path: str):
+        """
+        Load tasks from a file, keeping only the fields the pipeline
+        reads.
+
+        Same shape as load_calendar_streaming: incremental decode via
+        ijson when available, whole-file parse plus field projection
+        otherwise. Statuses are interned as in load_data so the
+        per-task status compare stays a pointer comparison.
+
+        Args:
+            task_path (str): Path to the tasks JSON file
+        """
+        fields = self._TASK_FIELDS
+        tasks = []
+        _append = tasks.append
+
+        if ijson is not None:
+            with open(task_path, 'rb') as f:
+                for task in ijson.items(f, "tasks.item"):
+                    _append({k: task[k] for k in fields if k in task})
+        else:
+            with open(task_path, 'r', encoding='utf-8') as f:
+                data = _loads(f.read())
+            for task in data.get("tasks", []):
+                _append({k: task[k] for k in fields if k in task})
+
+        for task in tasks:
+            status = task.get("status")
+            if type(status) is str:
+                task["status"] = sys.intern(status)
+
+        self.task_data = {"tasks": tasks}
+        self._index_tasks()
+
+    def _index_events(self):
+        """
+        Parse each event's start time exactly once at load. The epoch
+        timestamp is stored (rather than a datetime) so enriched events
+        stay JSON-serializable for the agent prompts, and events are
+        pre-sorted so consumers can binary-search the time window.
+        """
+        events = self.calendar_data.get("events", [])
+        for event in events:
+            try:
+                event["_start_ts"] = self.parse_datetime(event["start"]["dateTime"]).timestamp()
+            except (KeyError, ValueError):
+                continue
+        events.sort(key=lambda e: e.get("_start_ts", float("inf")))
+
+        # Aligned columns over the sorted events (unparseable entries
+        # sort to the tail and are excluded): the timestamp list is
+        # bisected and the matching events read back positionally
+        self._events_by_start = [e for e in events if "_start_ts" in e]
+        self._event_starts = [e["_start_ts"] for e in self._events_by_start]
+
+    def _index_tasks(self):
+        """
+        Build aligned due-time/task columns over the actionable tasks.
+
+        Status filtering, due-date parsing and the due_datetime
+        enrichment all happen once here; get_active_tasks then bisects
+        the sorted due column, which is O(log N + K) over contiguous
+        floats instead of a parse-and-compare pass per query.
+        """
+        due_tasks = []
+        for task in self.task_data.get("tasks", []):
+            if task.get("status") != _NEEDS_ACTION:
+                continue
+            due = task.get("due")
+            if not due:
+                continue
+            try:
+                due_date = self.parse_datetime(due)
+            except ValueError as e:
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning("Could not process task: %s", e)
+                continue
+            task["due_datetime"] = due_date
+            due_tasks.append((due_date.timestamp(), task))
+
+        due_tasks.sort(key=lambda pair: pair[0])
+        self._task_due = [ts for ts, _ in due_tasks]
+        self._task_refs = [task for _, task in due_tasks]
 
     def get_student_profile(self, student_id: str) -> Dict:
         """
@@ -43,13 +250,9 @@ class DataManager:
             Dict: Student profile data if found, None otherwise
 
         Implementation Note:
-            Uses generator expression with next() for efficient search through profiles,
-            avoiding full list iteration when possible.
+            Constant-time lookup against the id index built in load_data.
         """
-        if self.profile_data:
-            return next((p for p in self.profile_data["profiles"]
-                        if p["id"] == student_id), None)
-        return None
+        return self._profile_by_id.get(student_id)
 
     def parse_datetime(self, dt_str: str) -> datetime:
         """
@@ -62,18 +265,18 @@ class DataManager:
             datetime: Parsed datetime object in UTC timezone
 
         Implementation Note:
-            Handles both timezone-aware and naive datetime strings by:
-            1. First attempting to parse with timezone information
-            2. Falling back to assuming UTC if no timezone is specified
-        """
-        try:
-            # First attempt: Parse ISO format with timezone
-            dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-            return dt.astimezone(timezone.utc)
-        except ValueError:
-            # Fallback: Assume UTC if no timezone provided
-            dt = datetime.fromisoformat(dt_str)
-            return dt.replace(tzinfo=timezone.utc)
+            Called per event and per task inside the filtering loops, so
+            the hot path goes through ciso8601 when installed (one C call,
+            no string copy). Strings it rejects (e.g. naive datetimes)
+            and environments without ciso8601 use the stdlib fallback,
+            which handles both timezone-aware and naive inputs.
+        """
+        if _parse_rfc3339 is not None:
+            try:
+                return _parse_rfc3339(dt_str)
+            except ValueError:
+                pass
+        return _py_parse(dt_str)
 
     def get_upcoming_events(self, days: int = 7) -> List[Dict]:
         """
@@ -87,7 +290,10 @@ class DataManager:
 
         Implementation Note:
             - Uses UTC timestamps for consistent timezone handling
-            - Implements error handling for malformed event data
+            - Missing fields are handled with .get() chains rather than a
+              per-event try/except: exception setup is expensive and the
+              data is clean in the common case, so the exception path is
+              kept only around the actual parse
             - Only includes events that start in the future up to the specified timeframe
         """
         if not self.calendar_data:
@@ -96,16 +302,34 @@ class DataManager:
         now = datetime.now(timezone.utc)
         future = now + timedelta(days=days)
 
+        # Fast path: the window is contiguous in the pre-sorted start
+        # column, so two binary searches replace the linear scan and no
+        # datetime is parsed per query
+        if self._event_starts is not None:
+            lo = bisect_left(self._event_starts, now.timestamp())
+            hi = bisect_right(self._event_starts, future.timestamp())
+            return self._events_by_start[lo:hi]
+
+        # Fallback for calendar data assigned without going through
+        # load_data (no columns built)
         events = []
+        # Pre-bound to dodge per-iteration attribute lookups
+        _parse = self.parse_datetime
+        _append = events.append
         for event in self.calendar_data.get("events", []):
+            start = (event.get("start") or {}).get("dateTime")
+            if not start:
+                continue
             try:
-                start_time = self.parse_datetime(event["start"]["dateTime"])
-
-                if now <= start_time <= future:
-                    events.append(event)
-            except (KeyError, ValueError) as e:
-                print(f"Warning: Could not process event due to {str(e)}")
+                start_time = _parse(start)
+            except ValueError as e:
+                # Guarded so noisy datasets don't pay message formatting
+                # (or stdout flushes) when warnings are disabled
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning("Could not process event: %s", e)
                 continue
+            if now <= start_time <= future:
+                _append(event)
 
         return events
 
@@ -120,24 +344,45 @@ class DataManager:
             - Filters for tasks that are:
               1. Not completed ("needsAction" status)
               2. Due in the future
+            - The status check runs before the date parse, since a string
+              compare is far cheaper than datetime construction
             - Enriches task objects with parsed datetime for easier processing
-            - Implements robust error handling for malformed task data
         """
         if not self.task_data:
             return []
 
         now = datetime.now(timezone.utc)
+
+        # Fast path: actionable tasks are pre-filtered, pre-parsed and
+        # sorted by due time, so "due in the future" is one bisect
+        if self._task_due is not None:
+            idx = bisect_right(self._task_due, now.timestamp())
+            return self._task_refs[idx:]
+
+        # Fallback for task data assigned without going through
+        # load_data (no columns built)
         active_tasks = []
+        _parse = self.parse_datetime
+        _append = active_tasks.append
 
         for task in self.task_data.get("tasks", []):
+            # Equality (not `is`) so task data that skipped load_data's
+            # interning pass still matches; interned statuses short-cut
+            # via the identity check inside str.__eq__
+            if task.get("status") != _NEEDS_ACTION:
+                continue
+            due = task.get("due")
+            if not due:
+                continue
             try:
-                due_date = self.parse_datetime(task["due"])
-                if task["status"] == "needsAction" and due_date > now:
-                    # Enrich task object with parsed datetime
-                    task["due_datetime"] = due_date
-                    active_tasks.append(task)
-            except (KeyError, ValueError) as e:
-                print(f"Warning: Could not process task due to {str(e)}")
+                due_date = _parse(due)
+            except ValueError as e:
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning("Could not process task: %s", e)
                 continue
+            if due_date > now:
+                # Enrich task object with parsed datetime
+                task["due_datetime"] = due_date
+                _append(task)
 
         return active_tasks
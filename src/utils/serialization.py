@@ -0,0 +1,44 @@
+"""Serialization helpers for building agent prompts."""
+
+import json
+from collections import OrderedDict
+
+# Compact separators for JSON embedded in LLM prompts: indentation and
+# spacing only add billable tokens without helping the model
+COMPACT_SEPARATORS = (",", ":")
+
+# Bounded cache of serialized JSON keyed by object identity. Each entry
+# pins the object it serialized, so CPython cannot recycle that id onto
+# a different object while the entry lives, and hits re-verify identity
+# before trusting the key. Entries are evicted oldest-first once the
+# cache is full.
+_DUMPS_CACHE: "OrderedDict[int, tuple]" = OrderedDict()
+_DUMPS_CACHE_SIZE = 8
+
+
+def dumps_cached(obj) -> str:
+    """Serialize an object to compact JSON, caching by object identity.
+
+    Intended for session-lived objects such as the student profile and
+    learning preferences, which are serialized into several agent prompts
+    per turn but never change. Short-lived objects are safe to pass —
+    they simply miss and re-serialize: a hit requires the cached entry to
+    hold the very same object, so a recycled id can never serve another
+    object's JSON.
+
+    Args:
+        obj: JSON-serializable object to dump
+
+    Returns:
+        str: The serialized JSON text, without indentation
+    """
+    key = id(obj)
+    cached = _DUMPS_CACHE.get(key)
+    if cached is not None and cached[0] is obj:
+        return cached[1]
+
+    text = json.dumps(obj, separators=COMPACT_SEPARATORS)
+    _DUMPS_CACHE[key] = (obj, text)
+    if len(_DUMPS_CACHE) > _DUMPS_CACHE_SIZE:
+        _DUMPS_CACHE.popitem(last=False)
+    return text